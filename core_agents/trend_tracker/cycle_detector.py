@@ -5,6 +5,7 @@ Identifies Fed policy cycles, phases, and compares current cycle to historical c
 """
 
 import logging
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
@@ -34,6 +35,74 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# int8 codes for MeetingFrame labels; any other non-empty label is
+# OTHER_LABEL and a missing/empty one is NO_LABEL
+ACTION_CODES = {'decrease': -1, 'unchanged': 0, 'increase': 1}
+SENTIMENT_CODES = {
+    'highly_dovish': -2,
+    'dovish': -1,
+    'neutral': 0,
+    'hawkish': 1,
+    'highly_hawkish': 2
+}
+OTHER_LABEL = 3
+NO_LABEL = -128
+
+# Label -> code tables for MeetingFrame.from_dicts, with missing/empty
+# labels folded in so each meeting costs a single dict lookup
+_ACTION_LOOKUP = {**ACTION_CODES, None: NO_LABEL, '': NO_LABEL}
+_SENTIMENT_LOOKUP = {**SENTIMENT_CODES, None: NO_LABEL, '': NO_LABEL}
+
+
+@dataclass
+class MeetingFrame:
+    """
+    Column-oriented view of meeting records for cycle scans.
+    
+    Actions and sentiments are label-encoded once (see ACTION_CODES and
+    SENTIMENT_CODES) so windowed tallies become array arithmetic instead
+    of a Counter per window.
+    """
+    actions: np.ndarray
+    sentiments: np.ndarray
+    
+    @classmethod
+    def from_dicts(cls, meetings: List[Dict]) -> 'MeetingFrame':
+        """Encode the action and sentiment labels of each meeting."""
+        def encode(key: str, lookup: Dict[Optional[str], int]) -> np.ndarray:
+            return np.fromiter(
+                [lookup.get(m.get(key), OTHER_LABEL) for m in meetings],
+                dtype=np.int8,
+                count=len(meetings)
+            )
+        
+        return cls(
+            actions=encode('action', _ACTION_LOOKUP),
+            sentiments=encode('sentiment', _SENTIMENT_LOOKUP)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.actions)
+    
+    @staticmethod
+    def window_count_matrix(
+        codes: np.ndarray,
+        labels: Dict[str, int],
+        starts: np.ndarray,
+        stops: np.ndarray
+    ) -> np.ndarray:
+        """
+        Count each label in the windows codes[starts[k]:stops[k]].
+        
+        Returns one row per window and one column per label, in the order
+        of ``labels``, plus a final column for labels outside the table.
+        """
+        label_codes = np.array(list(labels.values()) + [OTHER_LABEL], dtype=np.int8)
+        # Window tallies never exceed the meeting count, so int32 is ample
+        prefix = np.zeros((len(codes) + 1, len(label_codes)), dtype=np.int32)
+        np.cumsum(codes[:, None] == label_codes, axis=0, out=prefix[1:])
+        return prefix[stops] - prefix[starts]
+
 
 class CycleDetector:
     """
@@ -93,8 +162,8 @@ class CycleDetector:
     
     def _classify_phase(
         self,
-        action_counts: Counter,
-        sentiment_counts: Counter,
+        action_counts: Dict[str, int],
+        sentiment_counts: Dict[str, int],
         recent_data: List[Dict]
     ) -> str:
         """
@@ -141,22 +210,69 @@ class CycleDetector:
         duration = 0
         lookback_window = 6
         
-        for i in range(len(all_data) - 1, max(0, len(all_data) - 24), -1):
-            window_start = max(0, i - lookback_window)
-            window = all_data[window_start:i+1]
-            
-            actions = [m.get('action') for m in window if m.get('action')]
-            sentiments = [m.get('sentiment') for m in window if m.get('sentiment')]
-            
-            phase = self._classify_phase(Counter(actions), Counter(sentiments), window)
-            
-            if phase == current_phase:
-                duration += 1
-            else:
-                break
+        # Window ends (newest first) and starts; only the tail they cover
+        # is encoded, and every window is tallied in one pass
+        ends = np.arange(len(all_data) - 1, max(0, len(all_data) - 24), -1)
+        if len(ends) == 0:
+            return duration
+        starts = np.maximum(ends - lookback_window, 0)
+        offset = int(starts.min())
+        frame = MeetingFrame.from_dicts(all_data[offset:])
+        
+        action_counts = frame.window_count_matrix(
+            frame.actions, ACTION_CODES, starts - offset, ends + 1 - offset
+        )
+        sentiment_counts = frame.window_count_matrix(
+            frame.sentiments, SENTIMENT_CODES, starts - offset, ends + 1 - offset
+        )
+        phases = self._classify_phases(action_counts, sentiment_counts, ends + 1 - starts)
+        
+        # Windows are newest first; count them until the phase changes
+        matches = phases == current_phase
+        duration = len(matches) if matches.all() else int(np.argmin(matches))
         
         return duration
     
+    def _classify_phases(
+        self,
+        action_counts: np.ndarray,
+        sentiment_counts: np.ndarray,
+        window_sizes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _classify_phase over many windows at once.
+        
+        Count matrices come from MeetingFrame.window_count_matrix (one row
+        per window); window_sizes holds the number of meetings in each.
+        """
+        actions = dict(zip(ACTION_CODES, action_counts.T))
+        sentiments = dict(zip(SENTIMENT_CODES, sentiment_counts.T))
+        total_actions = action_counts.sum(axis=1)
+        
+        cutting = actions['decrease'] >= total_actions * 0.5
+        hiking = actions['increase'] >= total_actions * 0.5
+        
+        return np.select(
+            [
+                cutting & ((sentiments['highly_dovish'] > 0) |
+                           (sentiments['dovish'] >= window_sizes * 0.6)),
+                cutting,
+                hiking & (sentiments['highly_hawkish'] >= 2),
+                hiking,
+                sentiments['dovish'] >= window_sizes * 0.4,
+                sentiments['hawkish'] >= window_sizes * 0.4
+            ],
+            [
+                "recession",
+                "slowdown",
+                "expansion_late",
+                "expansion_mid",
+                "expansion_early",
+                "expansion_late"
+            ],
+            default="expansion_mid"
+        )
+    
     def _predict_next_phase(self, current_phase: str, duration: int) -> str:
         """Predict next likely phase based on current phase and duration."""
         
@@ -227,46 +343,59 @@ class CycleDetector:
         """
         logger.info(f"Detecting peaks and troughs in {variable}")
         
-        df = pd.DataFrame(meeting_data)
-        
-        if variable not in df.columns:
+        # Pull out just the analysed column; a DataFrame of every meeting
+        # field costs far more than the peak search itself
+        if not any(variable in m for m in meeting_data):
             return {'error': f'Variable {variable} not found'}
         
-        values = df[variable].values
-        
-        # Find peaks
-        peaks, peak_props = signal.find_peaks(
-            values,
-            prominence=PEAK_TROUGH_CONFIG['prominence'],
-            distance=PEAK_TROUGH_CONFIG['distance'],
-            width=PEAK_TROUGH_CONFIG['width']
+        values = np.array(
+            [m.get(variable, np.nan) for m in meeting_data], dtype=np.float64
         )
         
-        # Find troughs (peaks in inverted signal)
-        troughs, trough_props = signal.find_peaks(
-            -values,
-            prominence=PEAK_TROUGH_CONFIG['prominence'],
-            distance=PEAK_TROUGH_CONFIG['distance'],
-            width=PEAK_TROUGH_CONFIG['width']
-        )
+        # A peak's prominence cannot exceed the series' full range, so a
+        # flatter series has no peaks or troughs to find
+        if values.size == 0 or np.ptp(values) < PEAK_TROUGH_CONFIG['prominence']:
+            peaks = troughs = np.empty(0, dtype=np.intp)
+        else:
+            # Find peaks
+            peaks, peak_props = signal.find_peaks(
+                values,
+                prominence=PEAK_TROUGH_CONFIG['prominence'],
+                distance=PEAK_TROUGH_CONFIG['distance'],
+                width=PEAK_TROUGH_CONFIG['width']
+            )
+            
+            # Find troughs (peaks in inverted signal)
+            troughs, trough_props = signal.find_peaks(
+                -values,
+                prominence=PEAK_TROUGH_CONFIG['prominence'],
+                distance=PEAK_TROUGH_CONFIG['distance'],
+                width=PEAK_TROUGH_CONFIG['width']
+            )
+        
+        # Dates are only read at turning points; a Series keeps pandas'
+        # handling of them (e.g. datetimes come back as Timestamps)
+        dates = None
+        if (len(peaks) or len(troughs)) and any('date' in m for m in meeting_data):
+            dates = pd.Series([m.get('date', np.nan) for m in meeting_data])
         
         # Build results
         peak_list = []
         for idx in peaks:
-            if idx < len(df):
+            if idx < len(values):
                 peak_list.append({
                     'index': int(idx),
-                    'date': df.iloc[idx]['date'] if 'date' in df.columns else idx,
+                    'date': dates.iloc[idx] if dates is not None else idx,
                     'value': round(float(values[idx]), 2),
                     'type': 'peak'
                 })
         
         trough_list = []
         for idx in troughs:
-            if idx < len(df):
+            if idx < len(values):
                 trough_list.append({
                     'index': int(idx),
-                    'date': df.iloc[idx]['date'] if 'date' in df.columns else idx,
+                    'date': dates.iloc[idx] if dates is not None else idx,
                     'value': round(float(values[idx]), 2),
                     'type': 'trough'
                 })
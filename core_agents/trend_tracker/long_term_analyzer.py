@@ -6,18 +6,23 @@ Identifies structural breaks, persistent patterns, and long-term shifts.
 """
 
 import logging
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 from scipy import stats, signal
-from sklearn.linear_model import LinearRegression
+from scipy.spatial.distance import pdist, squareform
 
 # Change point detection
 try:
     import ruptures as rpt
+    from ruptures.base import BaseCost
     RUPTURES_AVAILABLE = True
 except ImportError:
+    BaseCost = object
     RUPTURES_AVAILABLE = False
     logging.warning("ruptures not installed - change point detection limited")
 
@@ -42,6 +47,171 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _as_frame(meeting_data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+    """Return meeting data as a DataFrame, building one only if needed."""
+    if isinstance(meeting_data, pd.DataFrame):
+        return meeting_data
+    return pd.DataFrame(meeting_data)
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample std (ddof=1) of the non-NaN values; NaN if fewer than two."""
+    values = values[~np.isnan(values)]
+    return values.std(ddof=1) if values.size > 1 else np.nan
+
+
+def _mean_shift_penalty(signal_data: np.ndarray, per_log_n: float) -> float:
+    """
+    BIC-style PELT penalty for the L2 cost: per_log_n * noise variance * log(n).
+    
+    The noise level comes from the MAD of first differences, which a few
+    mean shifts barely move; a mostly flat (step-like) series falls back to
+    their standard deviation. Scaling by the noise keeps the penalty
+    meaningful for both scores (tens of points) and rates (a few percent).
+    """
+    n = len(signal_data)
+    diffs = np.diff(np.asarray(signal_data, dtype=float).reshape(n, -1), axis=0)
+    if diffs.size == 0:
+        return 1.0
+    
+    # Differencing doubles the noise variance
+    mad = np.median(np.abs(diffs - np.median(diffs, axis=0)), axis=0)
+    noise_var = float(np.sum((1.4826 * mad) ** 2)) / 2
+    if noise_var == 0:
+        noise_var = float(np.sum(diffs.var(axis=0))) / 2
+    if noise_var == 0:
+        # Constant signal: any positive penalty rules out every break
+        return 1.0
+    
+    return per_log_n * noise_var * np.log(n)
+
+
+class CostL2PrefixSum(BaseCost):
+    """
+    Least squared deviation cost backed by prefix sums.
+    
+    Same value as ruptures' built-in "l2" cost, but each segment cost is
+    O(1) instead of a variance over the slice. Sums are taken on the
+    mean-centred signal to limit cancellation, and segments with a single
+    repeated value cost exactly zero.
+    """
+    
+    model = "l2"
+    
+    def __init__(self):
+        """Initialize the cost."""
+        self.signal = None
+        self.csum = None
+        self.csum_sq = None
+        self.value_changes = None
+        self.min_size = 1
+    
+    def fit(self, signal) -> "CostL2PrefixSum":
+        """Precompute prefix sums of the centred signal and its square."""
+        if signal.ndim == 1:
+            self.signal = signal.reshape(-1, 1)
+        else:
+            self.signal = signal
+        
+        centred = self.signal - self.signal.mean(axis=0)
+        zeros = np.zeros((1, self.signal.shape[1]))
+        self.csum = np.concatenate((zeros, np.cumsum(centred, axis=0)))
+        self.csum_sq = np.concatenate((zeros, np.cumsum(centred ** 2, axis=0)))
+        
+        # value_changes[i] counts value changes among samples [0, i]
+        changed = np.any(self.signal[1:] != self.signal[:-1], axis=1)
+        self.value_changes = np.concatenate(([0], np.cumsum(changed)))
+        return self
+    
+    def error(self, start, end) -> float:
+        """Return the approximation cost on the segment [start:end]."""
+        if end - start < self.min_size:
+            raise rpt.NotEnoughPoints
+        
+        # Flat segment: no deviation to measure
+        if self.value_changes[end - 1] == self.value_changes[start]:
+            return 0.0
+        
+        seg_sum = self.csum[end] - self.csum[start]
+        seg_sum_sq = self.csum_sq[end] - self.csum_sq[start]
+        return max(float(np.sum(seg_sum_sq - seg_sum ** 2 / (end - start))), 0.0)
+
+
+@lru_cache(maxsize=32)
+def _rbf_gram_prefix_sums(
+    signal_bytes: bytes,
+    shape: Tuple[int, int],
+    gamma: Optional[float]
+) -> Tuple[np.ndarray, float]:
+    """
+    2-D prefix sums of the rbf Gram matrix of a float64 signal.
+    
+    Keyed on the signal's bytes, so repeated analyses of the same series
+    (e.g. successive tool calls on one meeting history) build the n x n
+    Gram matrix once. The returned array is read-only because it is shared.
+    
+    Returns:
+        Tuple of (prefix sums with a zero first row/column, gamma used)
+    """
+    signal_data = np.frombuffer(signal_bytes, dtype=np.float64).reshape(shape)
+    
+    sq_dists = pdist(signal_data, metric="sqeuclidean")
+    if gamma is None:
+        # Median heuristic, as in ruptures
+        median = np.median(sq_dists) if len(sq_dists) else 0
+        gamma = 1 / median if median != 0 else 1.0
+    sq_dists *= gamma
+    np.clip(sq_dists, 1e-2, 1e2, sq_dists)  # avoid exp under/overflow
+    gram = np.exp(squareform(-sq_dists))
+    
+    gram_csum = np.zeros((shape[0] + 1, shape[0] + 1))
+    gram_csum[1:, 1:] = gram.cumsum(axis=0).cumsum(axis=1)
+    gram_csum.flags.writeable = False
+    return gram_csum, gamma
+
+
+class CostRbfPrefixSum(BaseCost):
+    """
+    Kernel (rbf) cost backed by a 2-D prefix sum of the Gram matrix.
+    
+    Same value as ruptures' built-in "rbf" cost, including its median
+    heuristic for gamma, but each segment cost reads four prefix-sum
+    entries instead of summing a Gram sub-block. The prefix sums are
+    cached per signal content (see _rbf_gram_prefix_sums).
+    """
+    
+    model = "rbf"
+    
+    def __init__(self, gamma: Optional[float] = None):
+        """Initialize the cost."""
+        self.gamma = gamma
+        self.signal = None
+        self.gram_csum = None
+        self.min_size = 1
+    
+    def fit(self, signal) -> "CostRbfPrefixSum":
+        """Build the Gram matrix once and precompute its 2-D prefix sums."""
+        if signal.ndim == 1:
+            self.signal = signal.reshape(-1, 1)
+        else:
+            self.signal = signal
+        
+        signal_data = np.ascontiguousarray(self.signal, dtype=np.float64)
+        self.gram_csum, self.gamma = _rbf_gram_prefix_sums(
+            signal_data.tobytes(), signal_data.shape, self.gamma
+        )
+        return self
+    
+    def error(self, start, end) -> float:
+        """Return the approximation cost on the segment [start:end]."""
+        if end - start < self.min_size:
+            raise rpt.NotEnoughPoints
+        
+        csum = self.gram_csum
+        block = csum[end, end] - csum[start, end] - csum[end, start] + csum[start, start]
+        return float((end - start) - block / (end - start))
+
+
 class LongTermAnalyzer:
     """
     Analyze long-term Fed policy trends.
@@ -53,17 +223,20 @@ class LongTermAnalyzer:
     
     def analyze_long_term_trend(
         self,
-        meeting_data: List[Dict],
+        meeting_data: Union[List[Dict], pd.DataFrame],
         variable: str = 'score',
-        min_meetings: int = 24
+        min_meetings: int = 24,
+        changepoint_method: str = 'pelt'
     ) -> Dict:
         """
         Analyze long-term trend in policy variable.
         
         Args:
-            meeting_data: List of meeting data
+            meeting_data: List of meeting data (or a DataFrame built from it)
             variable: Variable to analyze ('score', 'fed_funds', etc.)
             min_meetings: Minimum meetings required
+            changepoint_method: Structural break method ('pelt' mean shifts,
+                'rbf', 'binseg', 'window'; see detect_changepoints)
         
         Returns:
             Dictionary with trend analysis
@@ -75,7 +248,7 @@ class LongTermAnalyzer:
                 'error': f'Insufficient data (need {min_meetings}, got {len(meeting_data)})'
             }
         
-        df = pd.DataFrame(meeting_data)
+        df = _as_frame(meeting_data)
         
         if variable not in df.columns:
             return {'error': f'Variable {variable} not found in data'}
@@ -84,20 +257,18 @@ class LongTermAnalyzer:
         df = df.dropna(subset=[variable])
         
         # Fit overall trend
-        X = np.arange(len(df)).reshape(-1, 1)
         y = df[variable].values
         
-        model = LinearRegression()
-        model.fit(X, y)
-        
-        y_pred = model.predict(X)
-        slope = model.coef_[0]
-        intercept = model.intercept_
-        
-        # Calculate R²
-        ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = np.sum((y - np.mean(y)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+        if len(y) < 2 or np.all(y == y[0]):
+            # Degenerate series (flat or single point) - nothing to fit
+            slope = 0.0
+            intercept = float(y[0]) if len(y) else 0.0
+            r_squared = 0.0
+        else:
+            fit = stats.linregress(np.arange(len(y)), y)
+            slope = fit.slope
+            intercept = fit.intercept
+            r_squared = fit.rvalue * fit.rvalue
         
         # Classify trend strength
         strength = self._classify_trend_strength(r_squared)
@@ -111,7 +282,7 @@ class LongTermAnalyzer:
             direction = "dovish_trend"
         
         # Detect change points
-        changepoints = self.detect_changepoints(df, variable)
+        changepoints = self.detect_changepoints(df, variable, changepoint_method)
         
         # Calculate persistence
         persistence = self._calculate_persistence(df, variable, slope)
@@ -141,7 +312,8 @@ class LongTermAnalyzer:
         Args:
             df: DataFrame with data
             variable: Variable to analyze
-            method: Detection method ('pelt', 'binseg', 'window')
+            method: Detection method ('pelt' for mean shifts, 'rbf' for PELT
+                with the kernel cost, 'binseg', 'window')
         
         Returns:
             List of detected changepoints
@@ -155,54 +327,18 @@ class LongTermAnalyzer:
         signal_data = df[variable].values
         
         try:
-            if method == 'pelt':
-                # PELT (Pruned Exact Linear Time)
-                algo = rpt.Pelt(
-                    model=CHANGEPOINT_METHODS['pelt']['model'],
-                    min_size=CHANGEPOINT_METHODS['pelt']['min_size']
-                )
-                result = algo.fit_predict(
-                    signal_data,
-                    pen=CHANGEPOINT_METHODS['pelt']['penalty']
-                )
-            
-            elif method == 'binseg':
-                # Binary Segmentation
-                algo = rpt.Binseg(
-                    model="l2",
-                    min_size=CHANGEPOINT_METHODS['binseg']['min_size']
-                )
-                result = algo.fit_predict(
-                    signal_data,
-                    n_bkps=CHANGEPOINT_METHODS['binseg']['n_bkps']
-                )
+            result = self._fit_breakpoints(signal_data, method)
             
-            else:
-                # Window-based
-                algo = rpt.Window(
-                    width=CHANGEPOINT_METHODS['window']['width'],
-                    model=CHANGEPOINT_METHODS['window']['model']
-                )
-                result = algo.fit_predict(
-                    signal_data,
-                    n_bkps=5
-                )
+            # Convert to changepoint dicts (last point is end of series)
+            indices = np.asarray(result[:-1], dtype=int)
+            indices = indices[indices < len(df)]
             
-            # Convert to changepoint dicts
-            changepoints = []
-            for idx in result[:-1]:  # Last point is end of series
-                if idx < len(df):
-                    cp_date = df.iloc[idx]['date'] if 'date' in df.columns else idx
-                    value_before = signal_data[max(0, idx-1)]
-                    value_after = signal_data[min(idx, len(signal_data)-1)]
-                    
-                    changepoints.append({
-                        'index': int(idx),
-                        'date': cp_date,
-                        'value_before': round(float(value_before), 2),
-                        'value_after': round(float(value_after), 2),
-                        'change': round(float(value_after - value_before), 2)
-                    })
+            changepoints = self._changepoint_records(
+                df,
+                indices,
+                signal_data[np.maximum(indices - 1, 0)],
+                signal_data[np.minimum(indices, len(signal_data) - 1)]
+            )
             
             logger.info(f"Detected {len(changepoints)} changepoints")
             return changepoints
@@ -211,6 +347,68 @@ class LongTermAnalyzer:
             logger.error(f"Change point detection failed: {e}")
             return self._simple_changepoint_detection(df, variable)
     
+    def _fit_breakpoints(
+        self,
+        signal_data: np.ndarray,
+        method: str
+    ) -> List[int]:
+        """Run the configured ruptures estimator and return its breakpoints."""
+        if method in ('pelt', 'rbf'):
+            # PELT (Pruned Exact Linear Time), on mean shifts or rbf kernel
+            algo = rpt.Pelt(
+                min_size=CHANGEPOINT_METHODS[method]['min_size'],
+                **self._changepoint_cost(CHANGEPOINT_METHODS[method]['model'])
+            )
+            result = algo.fit_predict(
+                signal_data,
+                pen=self._pelt_penalty(signal_data, method)
+            )
+        
+        elif method == 'binseg':
+            # Binary Segmentation
+            algo = rpt.Binseg(
+                min_size=CHANGEPOINT_METHODS['binseg']['min_size'],
+                **self._changepoint_cost("l2")
+            )
+            result = algo.fit_predict(
+                signal_data,
+                n_bkps=CHANGEPOINT_METHODS['binseg']['n_bkps']
+            )
+        
+        else:
+            # Window-based
+            algo = rpt.Window(
+                width=CHANGEPOINT_METHODS['window']['width'],
+                **self._changepoint_cost(CHANGEPOINT_METHODS['window']['model'])
+            )
+            result = algo.fit_predict(
+                signal_data,
+                n_bkps=5
+            )
+        
+        return result
+    
+    def _pelt_penalty(self, signal_data: np.ndarray, method: str) -> float:
+        """PELT penalty: scaled to the signal's noise for 'pelt', fixed for 'rbf'."""
+        config = CHANGEPOINT_METHODS[method]
+        if 'penalty' in config:
+            return config['penalty']
+        return _mean_shift_penalty(signal_data, config['penalty_per_log_n'])
+    
+    def _changepoint_cost(self, model: str) -> Dict:
+        """
+        Build the cost arguments for a ruptures estimator.
+        
+        L2 and rbf segments are scored with the prefix-sum costs; other
+        models fall back to the ruptures implementation.
+        """
+        if model == "l2":
+            return {'custom_cost': CostL2PrefixSum()}
+        if model == "rbf":
+            return {'custom_cost': CostRbfPrefixSum()}
+        
+        return {'model': model}
+    
     def _simple_changepoint_detection(
         self,
         df: pd.DataFrame,
@@ -223,30 +421,66 @@ class LongTermAnalyzer:
         signal_data = df[variable].values
         window = 6  # 1.5 years
         
-        # Calculate rolling mean
-        rolling_mean = pd.Series(signal_data).rolling(window=window, min_periods=1).mean()
+        # Calculate rolling mean (min_periods=1); pad so the first windows
+        # average only the points seen so far
+        padded = np.concatenate((np.full(window - 1, np.nan), signal_data))
+        rolling_mean = np.nanmean(
+            np.lib.stride_tricks.sliding_window_view(padded, window),
+            axis=1
+        )
         
-        # Find large changes in rolling mean
-        mean_changes = np.abs(np.diff(rolling_mean))
+        # Find large changes in rolling mean. Round away float noise so
+        # equal steps tie exactly at the percentile threshold.
+        mean_changes = np.round(np.abs(np.diff(rolling_mean)), 10)
         threshold = np.percentile(mean_changes, 80)  # Top 20%
         
-        changepoints = []
-        for i, change in enumerate(mean_changes):
-            if change > threshold and i > window:
-                if 'date' in df.columns and i < len(df):
-                    cp_date = df.iloc[i]['date']
-                else:
-                    cp_date = i
-                
-                changepoints.append({
-                    'index': int(i),
-                    'date': cp_date,
-                    'value_before': round(float(signal_data[i-1]), 2),
-                    'value_after': round(float(signal_data[i]), 2),
-                    'change': round(float(signal_data[i] - signal_data[i-1]), 2)
-                })
+        indices = np.flatnonzero(mean_changes > threshold)
+        indices = indices[indices > window]
+        
+        return self._changepoint_records(
+            df,
+            indices,
+            signal_data[indices - 1],
+            signal_data[indices]
+        )
+    
+    def _changepoint_records(
+        self,
+        df: pd.DataFrame,
+        indices: np.ndarray,
+        values_before: np.ndarray,
+        values_after: np.ndarray
+    ) -> List[Dict]:
+        """
+        Build changepoint dicts from parallel arrays.
         
-        return changepoints
+        Values are pulled out with a single tolist() per array, so rounding
+        works on native floats rather than boxing each NumPy scalar.
+        """
+        values_before = values_before.astype(float)
+        values_after = values_after.astype(float)
+        
+        if 'date' in df.columns:
+            dates = df['date'].iloc[indices].tolist()
+        else:
+            dates = indices.tolist()
+        
+        return [
+            {
+                'index': idx,
+                'date': cp_date,
+                'value_before': round(before, 2),
+                'value_after': round(after, 2),
+                'change': round(change, 2)
+            }
+            for idx, cp_date, before, after, change in zip(
+                indices.tolist(),
+                dates,
+                values_before.tolist(),
+                values_after.tolist(),
+                (values_after - values_before).tolist()
+            )
+        ]
     
     def _classify_trend_strength(self, r_squared: float) -> str:
         """Classify trend strength based on R²."""
@@ -327,7 +561,7 @@ class LongTermAnalyzer:
     
     def analyze_volatility(
         self,
-        meeting_data: List[Dict],
+        meeting_data: Union[List[Dict], pd.DataFrame],
         variable: str = 'score',
         windows: List[int] = [6, 12, 24]
     ) -> Dict:
@@ -335,7 +569,7 @@ class LongTermAnalyzer:
         Analyze volatility across different time windows.
         
         Args:
-            meeting_data: List of meeting data
+            meeting_data: List of meeting data (or a DataFrame built from it)
             variable: Variable to analyze
             windows: Window sizes to analyze
         
@@ -344,27 +578,30 @@ class LongTermAnalyzer:
         """
         logger.info(f"Analyzing volatility in {variable}")
         
-        df = pd.DataFrame(meeting_data)
+        df = _as_frame(meeting_data)
         
         if variable not in df.columns:
             return {'error': f'Variable {variable} not found'}
         
         volatility = {}
         
+        values = df[variable].to_numpy(dtype=np.float64)
+        
         for window in windows:
             if len(df) >= window:
-                rolling_std = df[variable].rolling(window=window).std()
+                windowed = np.lib.stride_tricks.sliding_window_view(values, window)
+                rolling_std = windowed.std(axis=1, ddof=1)
                 
                 volatility[f'window_{window}'] = {
-                    'mean_volatility': round(float(rolling_std.mean()), 2),
-                    'max_volatility': round(float(rolling_std.max()), 2),
-                    'current_volatility': round(float(rolling_std.iloc[-1]), 2) if len(rolling_std) > 0 else None
+                    'mean_volatility': round(float(np.nanmean(rolling_std)), 2),
+                    'max_volatility': round(float(np.nanmax(rolling_std)), 2),
+                    'current_volatility': round(float(rolling_std[-1]), 2) if len(rolling_std) > 0 else None
                 }
         
         # Overall volatility trend
         if len(df) >= 12:
-            recent_vol = df[variable].tail(12).std()
-            historical_vol = df[variable].std()
+            recent_vol = _sample_std(values[-12:])
+            historical_vol = _sample_std(values)
             
             if recent_vol > historical_vol * 1.2:
                 trend = "increasing"
@@ -407,7 +644,7 @@ class LongTermAnalyzer:
     
     def detect_regime_persistence(
         self,
-        meeting_data: List[Dict]
+        meeting_data: Union[List[Dict], pd.DataFrame]
     ) -> Dict:
         """
         Detect how long Fed stays in each regime.
@@ -416,40 +653,28 @@ class LongTermAnalyzer:
         """
         logger.info("Analyzing regime persistence")
         
-        df = pd.DataFrame(meeting_data)
+        df = _as_frame(meeting_data)
         
         if 'regime' not in df.columns:
             return {'error': 'Regime data not available'}
         
-        # Count regime durations
-        regime_durations = {}
-        current_regime = None
-        duration = 0
-        
-        for regime in df['regime']:
-            if regime == current_regime:
-                duration += 1
-            else:
-                if current_regime is not None:
-                    if current_regime not in regime_durations:
-                        regime_durations[current_regime] = []
-                    regime_durations[current_regime].append(duration)
-                
-                current_regime = regime
-                duration = 1
+        # Count regime durations (run-length encode the regime column)
+        regimes = df['regime'].to_numpy()
+        run_starts = np.flatnonzero(
+            np.concatenate(([True], regimes[1:] != regimes[:-1]))
+        )
+        run_lengths = np.diff(np.append(run_starts, len(regimes)))
         
-        # Add last regime
-        if current_regime is not None:
-            if current_regime not in regime_durations:
-                regime_durations[current_regime] = []
-            regime_durations[current_regime].append(duration)
+        regime_durations = {}
+        for regime, duration in zip(regimes[run_starts].tolist(), run_lengths.tolist()):
+            regime_durations.setdefault(regime, []).append(duration)
         
-        # Calculate statistics
+        # Calculate statistics (lists are tiny, so skip NumPy dispatch)
         regime_stats = {}
         for regime, durations in regime_durations.items():
             regime_stats[regime] = {
-                'average_duration': round(np.mean(durations), 1),
-                'median_duration': round(np.median(durations), 1),
+                'average_duration': round(statistics.fmean(durations), 1),
+                'median_duration': round(float(statistics.median(durations)), 1),
                 'max_duration': max(durations),
                 'min_duration': min(durations),
                 'num_occurrences': len(durations)
@@ -488,36 +713,41 @@ def analyze_long_term_patterns(meeting_data: List[Dict]) -> Dict:
     Returns:
         Complete long-term analysis
     """
-    analyzer = LongTermAnalyzer()
-    
-    # Analyze multiple variables
-    results = {}
-    
-    # Sentiment score trend
-    if any('score' in m for m in meeting_data):
-        results['sentiment_trend'] = analyzer.analyze_long_term_trend(
-            meeting_data,
-            variable='score'
-        )
+    # Each task gets its own analyzer so the changepoint cache is never
+    # shared between threads. The overlap comes from the NumPy/SciPy parts
+    # of each analysis; ruptures' PELT search itself holds the GIL.
+    futures = {}
     
-    # Fed Funds trend (if available)
-    if any('fed_funds' in m for m in meeting_data):
-        results['fed_funds_trend'] = analyzer.analyze_long_term_trend(
-            meeting_data,
-            variable='fed_funds'
-        )
-    
-    # Volatility analysis
-    if any('score' in m for m in meeting_data):
-        results['volatility'] = analyzer.analyze_volatility(
-            meeting_data,
-            variable='score'
-        )
-    
-    # Regime persistence
-    if any('regime' in m for m in meeting_data):
-        results['regime_persistence'] = analyzer.detect_regime_persistence(
-            meeting_data
-        )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Sentiment score trend
+        if any('score' in m for m in meeting_data):
+            futures['sentiment_trend'] = executor.submit(
+                LongTermAnalyzer().analyze_long_term_trend,
+                meeting_data,
+                variable='score'
+            )
+        
+        # Fed Funds trend (if available)
+        if any('fed_funds' in m for m in meeting_data):
+            futures['fed_funds_trend'] = executor.submit(
+                LongTermAnalyzer().analyze_long_term_trend,
+                meeting_data,
+                variable='fed_funds'
+            )
+        
+        # Volatility analysis
+        if any('score' in m for m in meeting_data):
+            futures['volatility'] = executor.submit(
+                LongTermAnalyzer().analyze_volatility,
+                meeting_data,
+                variable='score'
+            )
+        
+        # Regime persistence
+        if any('regime' in m for m in meeting_data):
+            futures['regime_persistence'] = executor.submit(
+                LongTermAnalyzer().detect_regime_persistence,
+                meeting_data
+            )
     
-    return results
+    return {key: future.result() for key, future in futures.items()}
@@ -5,11 +5,10 @@ Analyzes how Fed responds to economic data and tracks systematic forecast errors
 """
 
 import logging
-import pandas as pd
+from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from scipy import stats
-from sklearn.linear_model import LinearRegression
+from typing import Dict, List, Optional, Tuple, Union
 
 try:
     # Try relative imports first (when used as module)
@@ -36,6 +35,205 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _fit_ols(
+    X: np.ndarray,
+    y: np.ndarray
+) -> Tuple[float, List[float], float, Optional[List[float]]]:
+    """
+    Ordinary least squares with an intercept.
+    
+    Regressors and target are centred before the least-squares solve, as
+    sklearn's LinearRegression does, so a constant or collinear regressor
+    gets the minimum-norm (zero) share instead of an arbitrary split with
+    the intercept. Standard errors are heteroskedasticity-robust (HC0
+    sandwich estimator); a rank-deficient design has none.
+    
+    Args:
+        X: Regressors, shape (n_samples, n_features)
+        y: Target, shape (n_samples,)
+    
+    Returns:
+        Tuple of (intercept, coefficients, R², standard errors) as Python
+        floats; standard errors are ordered intercept first, or None when
+        the regressors are collinear
+    """
+    if not (np.all(np.isfinite(X)) and np.all(np.isfinite(y))):
+        raise ValueError("Input contains NaN or infinity")
+    
+    X_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    slopes, _, rank, _ = np.linalg.lstsq(X - X_mean, y - y_mean, rcond=None)
+    coef = np.concatenate(([y_mean - X_mean @ slopes], slopes))
+    
+    X_design = np.column_stack([np.ones(len(y)), X])
+    resid = y - X_design @ coef
+    ss_res = np.sum(resid ** 2)
+    ss_tot = np.sum((y - y.mean()) ** 2)
+    
+    # Constant target: perfect fit scores 1, anything else 0 (as sklearn)
+    if ss_tot == 0:
+        r_squared = 1.0 if ss_res == 0 else 0.0
+    else:
+        r_squared = float(1 - ss_res / ss_tot)
+    
+    # HC0: (X'X)^-1 X' diag(e²) X (X'X)^-1, only defined at full rank
+    if rank < X.shape[1]:
+        std_errors = None
+    else:
+        gram_inv = np.linalg.inv(X_design.T @ X_design)
+        meat = X_design.T @ (X_design * (resid * resid)[:, None])
+        std_errors = np.sqrt(np.abs(np.diag(gram_inv @ meat @ gram_inv))).tolist()
+    
+    intercept, *coefs = coef.tolist()
+    return intercept, coefs, r_squared, std_errors
+
+
+def _mean_present(values: np.ndarray) -> float:
+    """Mean of the non-NaN entries (NaN if there are none), without warnings."""
+    values = values[~np.isnan(values)]
+    return values.mean() if values.size else np.nan
+
+
+@lru_cache(maxsize=64)
+def _centred_index(n: int) -> np.ndarray:
+    """Observation index 0..n-1 centred on its mean (read-only, shared)."""
+    x = np.arange(n) - (n - 1) / 2
+    x.flags.writeable = False
+    return x
+
+
+def _error_trend(errors: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Time trend and half-sample means of a forecast error series.
+    
+    The regressor is just the observation index, so the OLS slope and R²
+    have a closed form and no design matrix is needed.
+    
+    Args:
+        errors: Forecast errors in time order
+    
+    Returns:
+        Tuple of (slope, R², recent mean, historical mean) as Python floats
+    """
+    n = len(errors)
+    x = _centred_index(n)
+    y = errors - errors.mean()
+    
+    sxx = n * (n * n - 1) / 12  # sum of squared centred indices
+    sxy = x @ y
+    syy = y @ y
+    
+    slope = sxy / sxx
+    # Constant errors are fitted exactly by a flat line
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 1.0
+    
+    mid_point = n // 2
+    recent_mean = errors[mid_point:].mean()
+    historical_mean = errors[:mid_point].mean()
+    return tuple(np.array([slope, r_squared, recent_mean, historical_mean]).tolist())
+
+
+def paired_forecast_errors(
+    forecasts: List[Dict],
+    actuals: List[Dict]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Actual - forecast errors for pairs where both sides have a value.
+    
+    Forecasts and actuals are matched pairwise, truncated to the shorter
+    list, and pairs with a missing (or NaN) value on either side dropped.
+    
+    Args:
+        forecasts: List of forecasts [{'value': ...}, ...]
+        actuals: List of actual outcomes [{'value': ...}, ...]
+    
+    Returns:
+        Tuple of (errors, positions of the kept pairs in forecasts)
+    """
+    n_pairs = min(len(forecasts), len(actuals))
+    f_vals = np.fromiter(
+        (f.get('value', np.nan) for f in forecasts[:n_pairs]),
+        dtype=np.float64, count=n_pairs
+    )
+    a_vals = np.fromiter(
+        (a.get('value', np.nan) for a in actuals[:n_pairs]),
+        dtype=np.float64, count=n_pairs
+    )
+    mask = ~(np.isnan(f_vals) | np.isnan(a_vals))
+    # Subtract in place into the masked copy
+    errors = a_vals[mask]
+    errors -= f_vals[mask]
+    return errors, np.flatnonzero(mask)
+
+
+# Integer codes for MeetingArrays.action (anything else, e.g. hold, is 0)
+ACTION_CODES = {'increase': 1, 'decrease': -1}
+
+# Plain-language reading of each detect_asymmetry outcome
+ASYMMETRY_INTERPRETATIONS = {
+    'cuts_faster': "Fed cuts rates faster/larger than it hikes (typical pattern)",
+    'hikes_faster': "Fed hiking faster than usual (unusual - suggests urgency)",
+    'symmetric': "Fed adjusts rates symmetrically in both directions",
+    'cuts_more_frequent': "Fed cuts more often than it hikes",
+    'hikes_more_frequent': "Fed hiking frequently (extended tightening cycle)"
+}
+
+
+@dataclass
+class MeetingArrays:
+    """
+    Column-oriented (one array per field) meeting/economic data.
+    
+    Accepted by the analyzers in place of a list of dicts, so callers that
+    already hold columns skip the per-call record parsing. A field is None
+    when no record carried it; missing entries in a present field are NaN.
+    """
+    fed_funds: Optional[np.ndarray] = None
+    inflation: Optional[np.ndarray] = None
+    unemployment: Optional[np.ndarray] = None
+    action: Optional[np.ndarray] = None  # int8, see ACTION_CODES
+    change_amount: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_dicts(
+        cls,
+        rows: List[Dict],
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> 'MeetingArrays':
+        """
+        Convert a list of records into columns (one pass per field).
+        
+        Args:
+            rows: Records keyed by field name
+            fields: Fields to convert (default: all); others are left None
+        """
+        wanted = fields or ('fed_funds', 'inflation', 'unemployment',
+                            'action', 'change_amount')
+        columns = {}
+        for key in wanted:
+            if not any(key in r for r in rows):
+                continue
+            if key == 'action':
+                columns[key] = np.fromiter(
+                    (ACTION_CODES.get(r.get(key), 0) for r in rows),
+                    dtype=np.int8,
+                    count=len(rows)
+                )
+            else:
+                columns[key] = np.array(
+                    [r.get(key, np.nan) for r in rows], dtype=np.float64
+                )
+        
+        return cls(**columns)
+    
+    def __len__(self) -> int:
+        for values in (self.fed_funds, self.inflation, self.unemployment,
+                       self.action, self.change_amount):
+            if values is not None:
+                return len(values)
+        return 0
+
+
 class ReactionFunctionAnalyzer:
     """
     Analyze Fed's reaction function - how Fed responds to economic data.
@@ -43,12 +241,11 @@ class ReactionFunctionAnalyzer:
     
     def __init__(self):
         """Initialize reaction function analyzer."""
-        logger.info("Initialized Reaction Function Analyzer")
     
     def estimate_taylor_rule(
         self,
         meeting_data: List[Dict],
-        economic_data: Optional[List[Dict]] = None
+        economic_data: Optional[Union[List[Dict], MeetingArrays]] = None
     ) -> Dict:
         """
         Estimate Fed's Taylor Rule parameters.
@@ -65,7 +262,8 @@ class ReactionFunctionAnalyzer:
         
         Args:
             meeting_data: Meeting data with fed_funds
-            economic_data: Economic data with inflation, unemployment
+            economic_data: Economic data with fed_funds, inflation, unemployment
+                (list of records or MeetingArrays)
         
         Returns:
             Estimated Taylor Rule parameters
@@ -75,50 +273,61 @@ class ReactionFunctionAnalyzer:
         if not economic_data or len(economic_data) < 12:
             return {'error': 'Need economic data to estimate Taylor Rule'}
         
-        df = pd.DataFrame(economic_data)
+        if not isinstance(economic_data, MeetingArrays):
+            economic_data = MeetingArrays.from_dicts(
+                economic_data, fields=('fed_funds', 'inflation', 'unemployment')
+            )
         
         # Required variables
         required = ['fed_funds', 'inflation', 'unemployment']
-        if not all(var in df.columns for var in required):
+        if any(getattr(economic_data, var) is None for var in required):
             return {'error': f'Need {required} in economic data'}
         
+        fed_funds = economic_data.fed_funds
+        inflation = economic_data.inflation
+        unemployment = economic_data.unemployment
+        
         # Calculate gaps
-        df['inflation_gap'] = df['inflation'] - TAYLOR_RULE_PARAMS['inflation_target']
+        inflation_gap = inflation - TAYLOR_RULE_PARAMS['inflation_target']
         
         # Unemployment gap (actual - natural rate, sign reversed)
         # Lower unemployment → positive gap → higher rates
         natural_unemployment = 4.0  # Rough estimate
-        df['unemployment_gap'] = -(df['unemployment'] - natural_unemployment)
+        unemployment_gap = -(unemployment - natural_unemployment)
         
         # Fit regression: fed_funds ~ inflation_gap + unemployment_gap
-        X = df[['inflation_gap', 'unemployment_gap']].values
-        y = df['fed_funds'].values
-        
-        model = LinearRegression(fit_intercept=True)
-        model.fit(X, y)
+        X = np.column_stack([inflation_gap, unemployment_gap])
+        y = fed_funds
         
-        inflation_coef = model.coef_[0]
-        unemployment_coef = model.coef_[1]
-        intercept = model.intercept_
+        intercept, coefs, r_squared, std_errors = _fit_ols(X, y)
+        inflation_coef, unemployment_coef = coefs
         
-        # Predict and calculate R²
-        y_pred = model.predict(X)
-        r_squared = model.score(X, y)
+        # Collinear gaps leave the coefficients without standard errors
+        if std_errors is None:
+            standard_errors = None
+        else:
+            intercept_se, inflation_se, unemployment_se = std_errors
+            standard_errors = {
+                'inflation': round(inflation_se, 3),
+                'unemployment': round(unemployment_se, 3),
+                'intercept': round(intercept_se, 3)
+            }
         
         # Compare to Taylor's original parameters
         taylor_original = TAYLOR_RULE_PARAMS
         
         return {
             'estimated_coefficients': {
-                'inflation': round(float(inflation_coef), 2),
-                'unemployment': round(float(unemployment_coef), 2),
-                'intercept': round(float(intercept), 2)
+                'inflation': round(inflation_coef, 2),
+                'unemployment': round(unemployment_coef, 2),
+                'intercept': round(intercept, 2)
             },
+            'standard_errors': standard_errors,
             'taylor_original': {
                 'inflation': taylor_original['inflation_coefficient'],
                 'output': taylor_original['output_coefficient']
             },
-            'r_squared': round(float(r_squared), 3),
+            'r_squared': round(r_squared, 3),
             'interpretation': self._interpret_taylor_rule(
                 inflation_coef,
                 unemployment_coef,
@@ -160,35 +369,44 @@ class ReactionFunctionAnalyzer:
     
     def detect_asymmetry(
         self,
-        meeting_data: List[Dict]
+        meeting_data: Union[List[Dict], MeetingArrays]
     ) -> Dict:
         """
         Detect asymmetry in Fed response (cuts faster than hikes).
         
         Args:
-            meeting_data: Meeting data with actions
+            meeting_data: Meeting data with actions (list of records or MeetingArrays)
         
         Returns:
             Asymmetry analysis
         """
         logger.info("Detecting reaction asymmetry")
         
-        df = pd.DataFrame(meeting_data)
+        if not isinstance(meeting_data, MeetingArrays):
+            # Check for actions before converting anything, then convert
+            # only the two fields this analysis reads
+            if not any('action' in d for d in meeting_data):
+                return {'error': 'Need action data'}
+            meeting_data = MeetingArrays.from_dicts(
+                meeting_data, fields=('action', 'change_amount')
+            )
         
-        if 'action' not in df.columns:
+        if meeting_data.action is None:
             return {'error': 'Need action data'}
         
         # Separate increases and decreases
-        increases = df[df['action'] == 'increase']
-        decreases = df[df['action'] == 'decrease']
+        increases = meeting_data.action == ACTION_CODES['increase']
+        decreases = meeting_data.action == ACTION_CODES['decrease']
+        num_increases = int(np.count_nonzero(increases))
+        num_decreases = int(np.count_nonzero(decreases))
         
-        if increases.empty or decreases.empty:
+        if not num_increases or not num_decreases:
             return {'asymmetry': 'unknown', 'interpretation': 'Need both hikes and cuts'}
         
         # Calculate average change per move (if magnitude available)
-        if 'change_amount' in df.columns:
-            avg_increase = increases['change_amount'].mean()
-            avg_decrease = decreases['change_amount'].mean()
+        if meeting_data.change_amount is not None:
+            avg_increase = _mean_present(meeting_data.change_amount[increases])
+            avg_decrease = _mean_present(meeting_data.change_amount[decreases])
             
             if avg_decrease > avg_increase * 1.5:
                 asymmetry = "cuts_faster"
@@ -198,8 +416,8 @@ class ReactionFunctionAnalyzer:
                 asymmetry = "symmetric"
         else:
             # Just count frequency
-            increase_freq = len(increases)
-            decrease_freq = len(decreases)
+            increase_freq = num_increases
+            decrease_freq = num_decreases
             
             if decrease_freq > increase_freq:
                 asymmetry = "cuts_more_frequent"
@@ -210,23 +428,14 @@ class ReactionFunctionAnalyzer:
         
         return {
             'asymmetry': asymmetry,
-            'num_increases': len(increases),
-            'num_decreases': len(decreases),
+            'num_increases': num_increases,
+            'num_decreases': num_decreases,
             'interpretation': self._interpret_asymmetry(asymmetry)
         }
     
     def _interpret_asymmetry(self, asymmetry: str) -> str:
         """Interpret asymmetry pattern."""
-        
-        patterns = {
-            'cuts_faster': "Fed cuts rates faster/larger than it hikes (typical pattern)",
-            'hikes_faster': "Fed hiking faster than usual (unusual - suggests urgency)",
-            'symmetric': "Fed adjusts rates symmetrically in both directions",
-            'cuts_more_frequent': "Fed cuts more often than it hikes",
-            'hikes_more_frequent': "Fed hiking frequently (extended tightening cycle)"
-        }
-        
-        return patterns.get(asymmetry, "Unknown pattern")
+        return ASYMMETRY_INTERPRETATIONS.get(asymmetry, "Unknown pattern")
 
 
 class ForecastBiasTracker:
@@ -236,7 +445,6 @@ class ForecastBiasTracker:
     
     def __init__(self):
         """Initialize forecast bias tracker."""
-        logger.info("Initialized Forecast Bias Tracker")
     
     def analyze_forecast_bias(
         self,
@@ -255,31 +463,32 @@ class ForecastBiasTracker:
         Returns:
             Bias analysis
         """
-        logger.info(f"Analyzing forecast bias for {variable}")
+        logger.info("Analyzing forecast bias for %s", variable)
         
         if len(forecasts) < BIAS_DETECTION_CONFIG['min_observations']:
             return {
                 'error': f"Need {BIAS_DETECTION_CONFIG['min_observations']} observations"
             }
         
-        # Match forecasts to actuals
-        errors = []
-        for f, a in zip(forecasts, actuals):
-            if 'value' in f and 'value' in a:
-                error = a['value'] - f['value']  # Actual - Forecast
-                errors.append(error)
+        errors, _ = paired_forecast_errors(forecasts, actuals)
         
-        if not errors:
+        if errors.size == 0:
             return {'error': 'No matching forecast-actual pairs'}
         
-        errors = np.array(errors)
-        
         # Calculate statistics
         mean_error = np.mean(errors)
         std_error = np.std(errors)
         
-        # Test for systematic bias
-        t_stat, p_value = stats.ttest_1samp(errors, 0)
+        # Test for systematic bias: one-sample t-test of mean error against 0,
+        # reusing the population std (sample std = std * sqrt(n / (n - 1)))
+        from scipy import special  # deferred: only the bias test needs scipy
+        
+        n = errors.size
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = mean_error * np.sqrt(n - 1) / std_error
+        # Two-sided p-value from the Student t CDF ufunc (what stats.t.sf
+        # evaluates, minus the distribution-object dispatch)
+        p_value = 2 * special.stdtr(n - 1, -abs(t_stat))
         has_bias = p_value < BIAS_DETECTION_CONFIG['significance_level']
         
         # Classify bias type
@@ -291,8 +500,9 @@ class ForecastBiasTracker:
             bias_type = "underestimation_bias"  # Forecasts too low
         
         # Calculate accuracy metrics
-        mae = np.mean(np.abs(errors))  # Mean absolute error
-        rmse = np.sqrt(np.mean(errors ** 2))  # Root mean squared error
+        abs_errors = np.abs(errors)
+        mae = abs_errors.mean()  # Mean absolute error
+        rmse = np.sqrt(np.dot(abs_errors, abs_errors) / len(errors))  # Root mean squared error
         
         return {
             'variable': variable,
@@ -353,15 +563,8 @@ class ForecastBiasTracker:
         
         errors = np.array(forecast_errors)
         
-        # Check for time trend in errors
-        X = np.arange(len(errors)).reshape(-1, 1)
-        y = errors
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        
-        slope = model.coef_[0]
-        r_squared = model.score(X, y)
+        # Check for time trend in errors, and recent vs historical means
+        slope, r_squared, recent_mean, historical_mean = _error_trend(errors)
         
         # Classify pattern
         if abs(slope) > 0.1 and r_squared > 0.3:
@@ -373,10 +576,6 @@ class ForecastBiasTracker:
             pattern = "stable"
         
         # Check for recent vs historical bias
-        mid_point = len(errors) // 2
-        recent_mean = np.mean(errors[mid_point:])
-        historical_mean = np.mean(errors[:mid_point])
-        
         if abs(recent_mean - historical_mean) > 0.5:
             recent_vs_historical = "shift_detected"
         else:
@@ -384,11 +583,11 @@ class ForecastBiasTracker:
         
         return {
             'pattern': pattern,
-            'trend_slope': round(float(slope), 3),
-            'r_squared': round(float(r_squared), 3),
+            'trend_slope': round(slope, 3),
+            'r_squared': round(r_squared, 3),
             'recent_vs_historical': recent_vs_historical,
-            'recent_mean_error': round(float(recent_mean), 2),
-            'historical_mean_error': round(float(historical_mean), 2),
+            'recent_mean_error': round(recent_mean, 2),
+            'historical_mean_error': round(historical_mean, 2),
             'interpretation': self._interpret_pattern(pattern, slope)
         }
     
@@ -403,9 +602,14 @@ class ForecastBiasTracker:
             return "Forecast bias stable over time"
 
 
+# Both analyzers are stateless, so one shared instance serves every call
+_REACTION = ReactionFunctionAnalyzer()
+_BIAS = ForecastBiasTracker()
+
+
 def analyze_reaction_and_bias(
-    meeting_data: List[Dict],
-    economic_data: Optional[List[Dict]] = None,
+    meeting_data: Union[List[Dict], MeetingArrays],
+    economic_data: Optional[Union[List[Dict], MeetingArrays]] = None,
     forecast_data: Optional[Dict] = None
 ) -> Dict:
     """
@@ -413,14 +617,27 @@ def analyze_reaction_and_bias(
     
     Args:
         meeting_data: Meeting data
-        economic_data: Economic conditions
+        economic_data: Economic conditions (may be the meeting data itself)
         forecast_data: Forecast vs actual data
     
     Returns:
         Complete analysis
     """
-    reaction_analyzer = ReactionFunctionAnalyzer()
-    bias_tracker = ForecastBiasTracker()
+    reaction_analyzer = _REACTION
+    bias_tracker = _BIAS
+    
+    # Convert records to columns once up front; when the economic conditions
+    # ride on the meeting records, one conversion serves both analyses
+    shared = economic_data is meeting_data
+    if not isinstance(meeting_data, MeetingArrays):
+        if shared:
+            meeting_data = MeetingArrays.from_dicts(meeting_data)
+        else:
+            meeting_data = MeetingArrays.from_dicts(
+                meeting_data, fields=('action', 'change_amount')
+            )
+    if shared:
+        economic_data = meeting_data
     
     results = {}
     
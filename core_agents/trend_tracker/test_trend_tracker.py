@@ -6,19 +6,33 @@ forecast bias tracking, and predictive indicators.
 """
 
 import pytest
+from collections import Counter
 import pandas as pd
 import numpy as np
+from scipy import stats
 from datetime import datetime, timedelta
 from typing import List, Dict
 
 # Import components
 try:
     # Try relative imports first (when used as module)
-    from .long_term_analyzer import LongTermAnalyzer, analyze_long_term_patterns
-    from .cycle_detector import CycleDetector, detect_policy_cycles
+    from .long_term_analyzer import (
+        LongTermAnalyzer,
+        CostL2PrefixSum,
+        CostRbfPrefixSum,
+        analyze_long_term_patterns
+    )
+    from .cycle_detector import (
+        ACTION_CODES,
+        SENTIMENT_CODES,
+        CycleDetector,
+        MeetingFrame,
+        detect_policy_cycles
+    )
     from .reaction_forecast_analysis import (
         ReactionFunctionAnalyzer,
         ForecastBiasTracker,
+        MeetingArrays,
         analyze_reaction_and_bias
     )
     from trend_tracker_tools import (
@@ -30,11 +44,23 @@ try:
     )
 except ImportError:
     # Fall back to absolute imports (when run directly)
-    from long_term_analyzer import LongTermAnalyzer, analyze_long_term_patterns
-    from cycle_detector import CycleDetector, detect_policy_cycles
+    from long_term_analyzer import (
+        LongTermAnalyzer,
+        CostL2PrefixSum,
+        CostRbfPrefixSum,
+        analyze_long_term_patterns
+    )
+    from cycle_detector import (
+        ACTION_CODES,
+        SENTIMENT_CODES,
+        CycleDetector,
+        MeetingFrame,
+        detect_policy_cycles
+    )
     from reaction_forecast_analysis import (
         ReactionFunctionAnalyzer,
         ForecastBiasTracker,
+        MeetingArrays,
         analyze_reaction_and_bias
     )
     from trend_tracker_tools import (
@@ -99,22 +125,25 @@ def long_term_meeting_data():
 def economic_data_with_rates():
     """Economic data for Taylor Rule estimation."""
     base_date = datetime(2015, 1, 1)
-    data = []
-    
-    for i in range(40):
-        # Simulate economic cycle
-        inflation = 1.5 + 0.1 * i + np.random.normal(0, 0.2)  # Rising inflation
-        unemployment = 5.0 - 0.05 * i + np.random.normal(0, 0.1)  # Falling unemployment
-        fed_funds = 0.25 + 0.1 * i
-        
-        data.append({
-            'date': (base_date + timedelta(days=i*45)).strftime('%Y-%m-%d'),
-            'inflation': round(inflation, 2),
-            'unemployment': round(unemployment, 2),
-            'fed_funds': round(fed_funds, 2)
-        })
-    
-    return data
+    rng = np.random.default_rng(0)
+    i = np.arange(40)
+    
+    # Simulate economic cycle
+    inflation = np.round(1.5 + 0.1 * i + rng.normal(0, 0.2, 40), 2)  # Rising inflation
+    unemployment = np.round(5.0 - 0.05 * i + rng.normal(0, 0.1, 40), 2)  # Falling unemployment
+    fed_funds = np.round(0.25 + 0.1 * i, 2)
+    
+    return [
+        {
+            'date': (base_date + timedelta(days=k * 45)).strftime('%Y-%m-%d'),
+            'inflation': infl,
+            'unemployment': unemp,
+            'fed_funds': rate
+        }
+        for k, infl, unemp, rate in zip(
+            i.tolist(), inflation.tolist(), unemployment.tolist(), fed_funds.tolist()
+        )
+    ]
 
 
 @pytest.fixture
@@ -172,6 +201,32 @@ class TestLongTermAnalyzer:
         assert isinstance(changepoints, list)
         # Should detect some change points in 40-meeting dataset
         # (accommodative → tightening → easing)
+
+    def test_detect_changepoints_mean_shift_scale_free(self):
+        """Test default PELT finds mean shifts whatever the variable's scale."""
+        rng = np.random.default_rng(1)
+        score = np.concatenate([
+            rng.normal(0, 3, 30), rng.normal(12, 3, 25), rng.normal(-5, 3, 25)
+        ])
+        df = pd.DataFrame({'score': score, 'fed_funds': score / 10})
+        
+        for variable in ('score', 'fed_funds'):
+            changepoints = LongTermAnalyzer().detect_changepoints(df, variable)
+            assert [cp['index'] for cp in changepoints] == [30, 55]
+        
+        flat = pd.DataFrame({'score': [2.0] * 40})
+        assert LongTermAnalyzer().detect_changepoints(flat, 'score') == []
+
+    def test_simple_changepoint_detection_step_data(self):
+        """Test the rolling-mean fallback on piecewise-constant data."""
+        analyzer = LongTermAnalyzer()
+        df = pd.DataFrame({'score': [0.1] * 15 + [0.7] * 15 + [0.3] * 15})
+        
+        changepoints = analyzer._simple_changepoint_detection(df, 'score')
+        
+        # Only the larger 0.1 -> 0.7 step clears the 80th percentile; the
+        # 0.7 -> 0.3 step ties with the threshold and must not be reported
+        assert [cp['index'] for cp in changepoints] == list(range(14, 20))
     
     def test_analyze_volatility(self, long_term_meeting_data):
         """Test volatility analysis."""
@@ -186,6 +241,24 @@ class TestLongTermAnalyzer:
         assert 'overall_trend' in result
         assert result['overall_trend'] in ['increasing', 'decreasing', 'stable', 'unknown']
     
+    def test_analyze_volatility_matches_pandas_rolling_std(self):
+        """Test rolling volatility matches pandas on a high-level series with a level shift."""
+        rng = np.random.default_rng(3)
+        score = np.concatenate([
+            200000 + rng.normal(0, 1, 40), 260000 + rng.normal(0, 1, 40)
+        ])
+        df = pd.DataFrame({'score': score})
+        
+        result = LongTermAnalyzer().analyze_volatility(df, variable='score')
+        
+        for window in (6, 12, 24):
+            expected = df['score'].rolling(window=window).std()
+            assert result['by_window'][f'window_{window}'] == {
+                'mean_volatility': round(float(expected.mean()), 2),
+                'max_volatility': round(float(expected.max()), 2),
+                'current_volatility': round(float(expected.iloc[-1]), 2)
+            }
+    
     def test_detect_regime_persistence(self, long_term_meeting_data):
         """Test regime persistence analysis."""
         analyzer = LongTermAnalyzer()
@@ -195,6 +268,126 @@ class TestLongTermAnalyzer:
         assert 'regime_statistics' in result
         # Should show accommodative and tightening regimes
         assert 'accommodative' in result['regime_statistics'] or 'tightening' in result['regime_statistics']
+    
+    def test_analyze_long_term_patterns(self, long_term_meeting_data):
+        """Test concurrent pattern analysis matches running each analysis in turn."""
+        result = analyze_long_term_patterns(long_term_meeting_data)
+        
+        expected = {
+            'sentiment_trend': LongTermAnalyzer().analyze_long_term_trend(
+                long_term_meeting_data, variable='score'
+            ),
+            'fed_funds_trend': LongTermAnalyzer().analyze_long_term_trend(
+                long_term_meeting_data, variable='fed_funds'
+            ),
+            'volatility': LongTermAnalyzer().analyze_volatility(
+                long_term_meeting_data, variable='score'
+            ),
+            'regime_persistence': LongTermAnalyzer().detect_regime_persistence(
+                long_term_meeting_data
+            )
+        }
+        
+        assert list(result) == list(expected)
+        assert result == expected
+
+
+class TestCostL2PrefixSum:
+    """Tests for the prefix-sum L2 changepoint cost."""
+    
+    def test_error_matches_ruptures_l2(self, long_term_meeting_data):
+        """Test segment costs against ruptures' built-in L2 cost."""
+        rpt = pytest.importorskip("ruptures")
+        
+        for variable in ['score', 'fed_funds']:
+            signal_data = pd.DataFrame(long_term_meeting_data)[variable].values
+            cost = CostL2PrefixSum().fit(signal_data)
+            reference = rpt.costs.CostL2().fit(signal_data)
+            
+            for start in range(0, len(signal_data), 3):
+                for end in range(start + 1, len(signal_data) + 1, 2):
+                    assert cost.error(start, end) == pytest.approx(
+                        reference.error(start, end), abs=1e-9
+                    )
+    
+    def test_flat_segment_costs_zero(self):
+        """Test flat segments cost exactly zero (no cancellation residue)."""
+        cost = CostL2PrefixSum().fit(np.array([0.1] * 20 + [0.3] * 20))
+        
+        assert cost.error(0, 20) == 0.0
+        assert cost.error(25, 40) == 0.0
+        assert cost.error(10, 30) > 0.0
+    
+    @pytest.mark.parametrize('method', ['binseg', 'window'])
+    def test_breakpoints_match_ruptures_l2(self, long_term_meeting_data, method):
+        """Test Binseg/Window find the same breaks as with the built-in cost."""
+        rpt = pytest.importorskip("ruptures")
+        
+        signals = [
+            np.array([0.1] * 20 + [0.3] * 20),
+            pd.DataFrame(long_term_meeting_data)['score'].values,
+            pd.DataFrame(long_term_meeting_data)['fed_funds'].values
+        ]
+        
+        for signal_data in signals:
+            if method == 'binseg':
+                fast = rpt.Binseg(min_size=6, custom_cost=CostL2PrefixSum())
+                reference = rpt.Binseg(min_size=6, model="l2")
+                n_bkps = 3
+            else:
+                fast = rpt.Window(width=12, custom_cost=CostL2PrefixSum())
+                reference = rpt.Window(width=12, model="l2")
+                n_bkps = 5
+            
+            assert fast.fit_predict(signal_data, n_bkps=n_bkps) == \
+                reference.fit_predict(signal_data, n_bkps=n_bkps)
+
+
+class TestCostRbfPrefixSum:
+    """Tests for the prefix-sum rbf changepoint cost."""
+    
+    def test_error_matches_ruptures_rbf(self, long_term_meeting_data):
+        """Test segment costs against ruptures' built-in rbf cost."""
+        rpt = pytest.importorskip("ruptures")
+        
+        for variable in ['score', 'fed_funds']:
+            signal_data = pd.DataFrame(long_term_meeting_data)[variable].values
+            cost = CostRbfPrefixSum().fit(signal_data)
+            reference = rpt.costs.CostRbf().fit(signal_data)
+            
+            assert cost.gamma == reference.gamma
+            for start in range(0, len(signal_data), 3):
+                for end in range(start + 1, len(signal_data) + 1, 2):
+                    assert cost.error(start, end) == pytest.approx(
+                        reference.error(start, end), abs=1e-9
+                    )
+    
+    def test_gram_shared_across_fits(self, long_term_meeting_data):
+        """Test refitting the same series reuses the cached Gram prefix sums."""
+        signal_data = pd.DataFrame(long_term_meeting_data)['score'].values
+        
+        first = CostRbfPrefixSum().fit(signal_data)
+        second = CostRbfPrefixSum().fit(signal_data.copy())
+        
+        assert second.gram_csum is first.gram_csum
+        assert not first.gram_csum.flags.writeable
+    
+    def test_pelt_breakpoints_match_ruptures_rbf(self, long_term_meeting_data):
+        """Test PELT finds the same breaks as with the built-in cost."""
+        rpt = pytest.importorskip("ruptures")
+        
+        signals = [
+            np.array([0.1] * 20 + [0.3] * 20 + [0.2] * 20),
+            pd.DataFrame(long_term_meeting_data)['score'].values,
+            pd.DataFrame(long_term_meeting_data)['fed_funds'].values
+        ]
+        
+        for signal_data in signals:
+            fast = rpt.Pelt(min_size=6, custom_cost=CostRbfPrefixSum())
+            reference = rpt.Pelt(min_size=6, model="rbf")
+            
+            assert fast.fit_predict(signal_data, pen=10) == \
+                reference.fit_predict(signal_data, pen=10)
 
 
 # ============================================================================
@@ -219,6 +412,72 @@ class TestCycleDetector:
             'slowdown', 'recession'
         ]
     
+    def test_phase_duration_counts_windows(self):
+        """Test phase duration counts back through matching 7-meeting windows."""
+        detector = CycleDetector()
+        meetings = (
+            [{'action': 'unchanged', 'sentiment': 'neutral'}] * 10 +
+            [{'action': 'decrease', 'sentiment': 'highly_dovish'}] * 6
+        )
+        
+        # Windows ending at the last three meetings hold 6, 5 and 4 cuts
+        # out of 7; the next one back (3 of 7) is no longer a majority
+        assert detector._calculate_phase_duration(meetings, 'recession') == 3
+        assert detector._calculate_phase_duration(meetings, 'slowdown') == 0
+    
+    def test_meeting_frame_window_count_matrix(self):
+        """Test label encoding and windowed tallies, incl. unknown labels."""
+        frame = MeetingFrame.from_dicts([
+            {'action': 'increase', 'sentiment': 'hawkish'},
+            {'action': 'hold', 'sentiment': None},
+            {'sentiment': 'dovish'},
+            {'action': 'increase', 'sentiment': 'hawkish'}
+        ])
+        
+        counts = MeetingFrame.window_count_matrix(
+            frame.actions,
+            {'decrease': -1, 'increase': 1},
+            np.array([0, 1]),
+            np.array([4, 3])
+        )
+        
+        assert len(frame) == 4
+        # Columns: decrease, increase, then labels outside the table
+        assert counts.tolist() == [[0, 2, 1], [0, 0, 1]]
+    
+    def test_classify_phases_matches_scalar(self):
+        """Vectorized window classification agrees with _classify_phase."""
+        detector = CycleDetector()
+        rng = np.random.default_rng(0)
+        meetings = [
+            {
+                'action': rng.choice(['increase', 'decrease', 'unchanged', '']),
+                'sentiment': rng.choice(
+                    ['highly_dovish', 'dovish', 'neutral', 'hawkish', 'highly_hawkish']
+                )
+            }
+            for _ in range(200)
+        ]
+        starts = np.arange(0, 193)
+        stops = starts + 7
+        frame = MeetingFrame.from_dicts(meetings)
+        
+        phases = detector._classify_phases(
+            MeetingFrame.window_count_matrix(frame.actions, ACTION_CODES, starts, stops),
+            MeetingFrame.window_count_matrix(frame.sentiments, SENTIMENT_CODES, starts, stops),
+            stops - starts
+        )
+        
+        expected = [
+            detector._classify_phase(
+                Counter(m['action'] for m in meetings[a:b] if m['action']),
+                Counter(m['sentiment'] for m in meetings[a:b]),
+                meetings[a:b]
+            )
+            for a, b in zip(starts, stops)
+        ]
+        assert phases.tolist() == expected
+    
     def test_detect_peaks_and_troughs(self, long_term_meeting_data):
         """Test peak/trough detection."""
         detector = CycleDetector()
@@ -233,6 +492,23 @@ class TestCycleDetector:
         # Should detect at least one peak (max rate)
         assert result['num_peaks'] >= 0 or result['num_troughs'] >= 0
     
+    def test_detect_peaks_and_troughs_dates_and_flat_series(self):
+        """Peaks carry their meeting date; a series flatter than the prominence has none."""
+        detector = CycleDetector()
+        values = 10 * np.sin(np.arange(60) / 4)
+        meetings = [
+            {'date': f'2000-{i:02d}', 'fed_funds': v} for i, v in enumerate(values)
+        ]
+        
+        result = detector.detect_peaks_and_troughs(meetings)
+        flat = detector.detect_peaks_and_troughs(
+            [{'fed_funds': v / 10} for v in values]
+        )
+        
+        assert result['num_peaks'] > 0 and result['num_troughs'] > 0
+        assert all(p['date'] == f"2000-{p['index']:02d}" for p in result['peaks'])
+        assert flat['num_peaks'] == 0 and flat['num_troughs'] == 0
+    
     def test_calculate_cycle_metrics(self, long_term_meeting_data):
         """Test cycle metrics calculation."""
         detector = CycleDetector()
@@ -277,6 +553,96 @@ class TestReactionFunctionAnalyzer:
         assert 'inflation' in coefs
         assert 'unemployment' in coefs
     
+    def test_estimate_taylor_rule_exact_fit(self, long_term_meeting_data):
+        """Coefficients of an exact linear rule are recovered."""
+        analyzer = ReactionFunctionAnalyzer()
+        economic_data = []
+        for i in range(20):
+            inflation = 1.0 + 0.3 * i
+            unemployment = 6.0 - 0.2 * i + (0.5 if i % 3 == 0 else 0.0)
+            fed_funds = 1.0 + 1.5 * (inflation - 2.0) + 0.5 * (4.0 - unemployment)
+            economic_data.append({
+                'fed_funds': fed_funds,
+                'inflation': inflation,
+                'unemployment': unemployment
+            })
+        
+        result = analyzer.estimate_taylor_rule(long_term_meeting_data, economic_data)
+        
+        assert result['estimated_coefficients'] == {
+            'inflation': 1.5, 'unemployment': 0.5, 'intercept': 1.0
+        }
+        assert result['r_squared'] == 1.0
+    
+    def test_estimate_taylor_rule_constant_regressor(self, long_term_meeting_data):
+        """A constant regressor gets a zero coefficient, as in sklearn."""
+        analyzer = ReactionFunctionAnalyzer()
+        economic_data = [
+            {
+                'fed_funds': 3.0 + 0.5 * (4.0 - (6.0 - 0.2 * i)),
+                'inflation': 2.3,
+                'unemployment': 6.0 - 0.2 * i
+            }
+            for i in range(20)
+        ]
+        
+        result = analyzer.estimate_taylor_rule(long_term_meeting_data, economic_data)
+        
+        assert result['estimated_coefficients'] == {
+            'inflation': 0.0, 'unemployment': 0.5, 'intercept': 3.0
+        }
+        # No robust standard errors for an unidentified coefficient
+        assert result['standard_errors'] is None
+    
+    def test_estimate_taylor_rule_robust_standard_errors(
+        self, long_term_meeting_data, economic_data_with_rates
+    ):
+        """Standard errors match statsmodels' HC0 covariance."""
+        sm = pytest.importorskip('statsmodels.api')
+        analyzer = ReactionFunctionAnalyzer()
+        result = analyzer.estimate_taylor_rule(
+            long_term_meeting_data, economic_data_with_rates
+        )
+        
+        X = np.array([
+            [d['inflation'] - 2.0, 4.0 - d['unemployment']]
+            for d in economic_data_with_rates
+        ])
+        y = np.array([d['fed_funds'] for d in economic_data_with_rates])
+        expected = sm.OLS(y, sm.add_constant(X)).fit(cov_type='HC0').bse
+        
+        se = result['standard_errors']
+        assert [se['intercept'], se['inflation'], se['unemployment']] == \
+            pytest.approx(expected, abs=1e-3)
+    
+    def test_meeting_arrays_input(self, long_term_meeting_data, economic_data_with_rates):
+        """Column-oriented input gives the same results as records."""
+        analyzer = ReactionFunctionAnalyzer()
+        economic_arrays = MeetingArrays.from_dicts(economic_data_with_rates)
+        meeting_arrays = MeetingArrays.from_dicts(long_term_meeting_data)
+        
+        assert len(economic_arrays) == len(economic_data_with_rates)
+        assert analyzer.estimate_taylor_rule(
+            long_term_meeting_data, economic_arrays
+        ) == analyzer.estimate_taylor_rule(
+            long_term_meeting_data, economic_data_with_rates
+        )
+        assert analyzer.detect_asymmetry(meeting_arrays) == \
+            analyzer.detect_asymmetry(long_term_meeting_data)
+    
+    def test_analyze_reaction_and_bias_shared_records(self, economic_data_with_rates):
+        """Passing one list as both inputs matches passing two copies."""
+        records = [
+            dict(row, action='increase' if i % 3 else 'decrease')
+            for i, row in enumerate(economic_data_with_rates)
+        ]
+        
+        shared = analyze_reaction_and_bias(records, records)
+        separate = analyze_reaction_and_bias(records, [dict(r) for r in records])
+        
+        assert 'estimated_coefficients' in shared['taylor_rule']
+        assert shared == separate
+    
     def test_detect_asymmetry(self, long_term_meeting_data):
         """Test asymmetry detection."""
         analyzer = ReactionFunctionAnalyzer()
@@ -288,6 +654,23 @@ class TestReactionFunctionAnalyzer:
             'cuts_faster', 'hikes_faster', 'symmetric',
             'cuts_more_frequent', 'hikes_more_frequent'
         ]
+    
+    def test_detect_asymmetry_change_amounts(self):
+        """Average move sizes ignore meetings without a change amount."""
+        analyzer = ReactionFunctionAnalyzer()
+        meeting_data = [
+            {'action': 'increase', 'change_amount': 0.25},
+            {'action': 'increase'},
+            {'action': 'hold', 'change_amount': 0.0},
+            {'action': 'decrease', 'change_amount': 0.5},
+            {'action': 'decrease', 'change_amount': float('nan')},
+        ]
+        
+        result = analyzer.detect_asymmetry(meeting_data)
+        
+        assert result['asymmetry'] == 'cuts_faster'
+        assert result['num_increases'] == 2
+        assert result['num_decreases'] == 2
 
 
 # ============================================================================
@@ -315,6 +698,23 @@ class TestForecastBiasTracker:
         # Should detect underestimation bias (forecasts 2.1-5.4, actual 6.5)
         assert result['bias_type'] == 'underestimation_bias'
     
+    def test_analyze_forecast_bias_skips_unmatched_pairs(self):
+        """Pairs missing a value are dropped and extra actuals are ignored."""
+        tracker = ForecastBiasTracker()
+        forecasts = [{'value': 2.0 + 0.1 * i} for i in range(14)]
+        forecasts[3] = {'date': '2022-03-16'}
+        actuals = [{'value': 3.0}] * 16
+        actuals[5] = {}
+        
+        result = tracker.analyze_forecast_bias(forecasts, actuals)
+        
+        errors = np.array([
+            3.0 - f['value'] for i, f in enumerate(forecasts) if i not in (3, 5)
+        ])
+        assert result['num_observations'] == 12
+        assert result['mean_error'] == round(float(errors.mean()), 2)
+        assert result['rmse'] == round(float(np.sqrt(np.mean(errors ** 2))), 2)
+    
     def test_identify_bias_patterns(self):
         """Test bias pattern identification."""
         tracker = ForecastBiasTracker()
@@ -329,6 +729,19 @@ class TestForecastBiasTracker:
         assert result['pattern'] in ['improving', 'deteriorating', 'stable']
         # Should show deteriorating
         assert result['pattern'] == 'deteriorating'
+    
+    def test_identify_bias_patterns_matches_linregress(self):
+        """Trend statistics agree with scipy's linregress."""
+        tracker = ForecastBiasTracker()
+        errors = [0.4, -0.2, 0.9, 0.1, 1.3, 0.6, 1.8, 1.1, 2.4]
+        
+        result = tracker.identify_bias_patterns(errors, list(range(len(errors))))
+        
+        fit = stats.linregress(np.arange(len(errors)), errors)
+        assert result['trend_slope'] == round(float(fit.slope), 3)
+        assert result['r_squared'] == round(float(fit.rvalue ** 2), 3)
+        assert result['recent_mean_error'] == round(float(np.mean(errors[4:])), 2)
+        assert result['historical_mean_error'] == round(float(np.mean(errors[:4])), 2)
 
 
 # ============================================================================
@@ -349,6 +762,20 @@ class TestTrendTrackerTools:
         assert 'volatility' in result
         assert 'summary' in result
     
+    def test_tool_results_cached_by_content(self, long_term_meeting_data):
+        """Equal inputs reuse the cached result; callers get independent copies."""
+        analyze_long_term_trends_tool.cache_clear()
+        first = analyze_long_term_trends_tool(long_term_meeting_data, variable='score')
+        first['trend_analysis']['direction'] = 'mutated'
+        
+        again = analyze_long_term_trends_tool(
+            [dict(m) for m in long_term_meeting_data],
+            'score'
+        )
+        
+        assert again['trend_analysis']['direction'] != 'mutated'
+        assert again == analyze_long_term_trends_tool(long_term_meeting_data)
+    
     def test_detect_policy_cycles_tool(self, long_term_meeting_data):
         """Test policy cycles tool."""
         result = detect_policy_cycles_tool(long_term_meeting_data)
@@ -392,6 +819,24 @@ class TestTrendTrackerTools:
         assert 'active_indicators' in result
         assert 'predicted_action' in result
         assert 'confidence' in result
+    
+    def test_predictive_indicators_mixed_directions(self):
+        """A dovish shift against two tightening signals still predicts a hike."""
+        meetings = [{'score': 20}] * 3 + [{'score': 5}] * 3
+        result = generate_predictive_indicators_tool(
+            meetings,
+            current_economic_data={'inflation': 3.0, 'unemployment': 3.0}
+        )
+        
+        assert [ind['indicator'] for ind in result['active_indicators']] == [
+            'sentiment_shift', 'inflation_persistence', 'unemployment_gap'
+        ]
+        assert 'Rate cut' in result['active_indicators'][0]['implication']
+        assert [ind['direction'] for ind in result['active_indicators']] == [
+            'ease', 'tighten', 'tighten'
+        ]
+        assert result['predicted_action'] == 'hike'
+        assert result['time_horizon'] == 2
 
 
 # ============================================================================
@@ -404,12 +849,12 @@ def example_usage_long_term_trends():
     print("EXAMPLE: Long-Term Trend Analysis")
     print("="*60)
     
-    # Create sample 10-year dataset
-    base_date = datetime(2015, 1, 1)
+    # Create sample 10-year dataset (a meeting every 45 days)
+    dates = np.datetime64('2015-01-01') + np.arange(40) * np.timedelta64(45, 'D')
     meetings = []
-    for i in range(40):
+    for i, date in enumerate(dates.astype(str).tolist()):
         meetings.append({
-            'date': (base_date + timedelta(days=i*45)).strftime('%Y-%m-%d'),
+            'date': date,
             'score': -10 + i * 0.7,  # Hawkish trend
             'fed_funds': 0.25 + i * 0.1
         })
@@ -429,14 +874,14 @@ def example_usage_cycle_detection():
     print("EXAMPLE: Policy Cycle Detection")
     print("="*60)
     
-    # Create sample cycle data
+    # Create sample cycle data (a meeting every 45 days)
     meetings = []
-    base_date = datetime(2020, 1, 1)
+    dates = (np.datetime64('2020-01-01') + np.arange(20) * np.timedelta64(45, 'D')).astype(str).tolist()
     
     # Accommodative phase
     for i in range(10):
         meetings.append({
-            'date': (base_date + timedelta(days=i*45)).strftime('%Y-%m-%d'),
+            'date': dates[i],
             'action': 'unchanged',
             'sentiment': 'dovish',
             'fed_funds': 0.25
@@ -445,7 +890,7 @@ def example_usage_cycle_detection():
     # Tightening phase
     for i in range(10):
         meetings.append({
-            'date': (base_date + timedelta(days=(10+i)*45)).strftime('%Y-%m-%d'),
+            'date': dates[10 + i],
             'action': 'increase' if i % 2 == 0 else 'unchanged',
             'sentiment': 'hawkish',
             'fed_funds': 0.25 + i * 0.25
@@ -43,6 +43,15 @@ retry_config = types.HttpRetryOptions(
     http_status_codes=[429, 500, 503, 504],
 )
 
+# Tool wrappers are stateless, so every agent shares one set
+TREND_TRACKER_TOOLS = [
+    FunctionTool(analyze_long_term_trends_tool),
+    FunctionTool(detect_policy_cycles_tool),
+    FunctionTool(analyze_reaction_function_tool),
+    FunctionTool(track_forecast_bias_tool),
+    FunctionTool(generate_predictive_indicators_tool)
+]
+
 
 def create_trend_tracker_agent(model: str = "gemini-2.5-flash-lite") -> LlmAgent:
     """
@@ -284,13 +293,7 @@ def create_trend_tracker_agent(model: str = "gemini-2.5-flash-lite") -> LlmAgent
         
         Always acknowledge uncertainty and provide confidence intervals where possible.
         """,
-        tools=[
-            FunctionTool(analyze_long_term_trends_tool),
-            FunctionTool(detect_policy_cycles_tool),
-            FunctionTool(analyze_reaction_function_tool),
-            FunctionTool(track_forecast_bias_tool),
-            FunctionTool(generate_predictive_indicators_tool)
-        ]
+        tools=list(TREND_TRACKER_TOOLS)
     )
     
     logger.info("Trend Tracker agent created successfully")
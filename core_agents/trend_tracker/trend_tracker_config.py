@@ -132,9 +132,14 @@ AVERAGE_CYCLE_METRICS = {
 # Change point detection settings
 CHANGEPOINT_METHODS = {
     "pelt": {
+        "penalty_per_log_n": 2,     # BIC: penalty = 2 * noise variance * log(n)
+        "min_size": 6,              # Minimum segment size (1.5 years)
+        "model": "l2"               # Mean shifts (least squares)
+    },
+    "rbf": {
         "penalty": 10,              # Higher = fewer change points
         "min_size": 6,              # Minimum segment size (1.5 years)
-        "model": "rbf"              # Radial basis function
+        "model": "rbf"              # Radial basis function (any distribution change)
     },
     "binseg": {
         "n_bkps": 5,                # Number of breakpoints to find
@@ -435,23 +440,33 @@ TREND_ANALYSIS_SCHEMA = {
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def validate_config() -> List[str]:
-    """Validate trend tracker configuration and return list of issues."""
+def _collect_config_issues() -> List[str]:
+    """Check the configuration dicts above and return list of issues."""
     issues = []
     
-    # Check analysis periods
-    for period_name, period_data in ANALYSIS_PERIODS.items():
-        if period_data["years"] <= 0:
-            issues.append(f"Analysis period {period_name} must have positive years")
+    # Check time horizons
+    for horizon_name, meetings in TIME_HORIZONS.items():
+        if meetings <= 0:
+            issues.append(f"Time horizon {horizon_name} must have positive meetings")
     
-    # Check cycle thresholds
-    cycle_thresholds = CYCLE_DETECTION["thresholds"]
-    if cycle_thresholds["significance"] <= 0 or cycle_thresholds["significance"] >= 1:
-        issues.append("Cycle significance threshold must be between 0 and 1")
+    # Check significance levels
+    if not 0 < BIAS_DETECTION_CONFIG["significance_level"] < 1:
+        issues.append("Bias detection significance level must be between 0 and 1")
+    if not 0 < GRANGER_CONFIG["significance"] < 1:
+        issues.append("Granger significance level must be between 0 and 1")
     
     return issues
 
 
+# The settings above are module constants, so validate them once at import
+_CONFIG_ISSUES = tuple(_collect_config_issues())
+
+
+def validate_config() -> List[str]:
+    """Validate trend tracker configuration and return list of issues."""
+    return list(_CONFIG_ISSUES)
+
+
 def get_config_info() -> Dict[str, any]:
     """Get current configuration information."""
     return {
@@ -465,5 +480,4 @@ def get_config_info() -> Dict[str, any]:
 
 def is_fully_configured() -> bool:
     """Check if trend tracker is fully configured."""
-    issues = validate_config()
-    return len(issues) == 0
+    return not _CONFIG_ISSUES
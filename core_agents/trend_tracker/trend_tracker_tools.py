@@ -5,37 +5,101 @@ ADK tools for long-term Fed policy analysis: trends, cycles, reaction function,
 forecast bias, and predictive indicators.
 """
 
+import copy
+import hashlib
+import importlib
+import inspect
 import logging
-from typing import Dict, List, Optional
+import pickle
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 from google.adk.tools.tool_context import ToolContext
 
 try:
     # Try relative imports first (when used as module)
-    from .long_term_analyzer import LongTermAnalyzer, analyze_long_term_patterns
-    from .cycle_detector import CycleDetector, detect_policy_cycles
-    from .reaction_forecast_analysis import (
-        ReactionFunctionAnalyzer,
-        ForecastBiasTracker,
-        analyze_reaction_and_bias
-    )
+    from .trend_tracker_config import LEADING_INDICATORS
 except ImportError:
     # Fall back to absolute imports (when run directly)
-    from long_term_analyzer import LongTermAnalyzer, analyze_long_term_patterns
-    from cycle_detector import CycleDetector, detect_policy_cycles
-    from reaction_forecast_analysis import (
-        ReactionFunctionAnalyzer,
-        ForecastBiasTracker,
-        analyze_reaction_and_bias
-    )
+    from trend_tracker_config import LEADING_INDICATORS
 
 logger = logging.getLogger(__name__)
 
 
+def _analysis_module(name: str) -> ModuleType:
+    """
+    Import a trend tracker analysis module on first use.
+    
+    The analyzers pull in pandas, scipy and ruptures, which creating the
+    agent does not need; after the first call this is a sys.modules lookup.
+    """
+    if __package__:
+        return importlib.import_module(f'.{name}', __package__)
+    return importlib.import_module(name)
+
+
+@lru_cache(maxsize=64)
+def _humanize(label: str, title: bool = False) -> str:
+    """Spell out a snake_case label (e.g. 'strong_trend' -> 'Strong Trend')."""
+    text = label.replace('_', ' ')
+    return text.title() if title else text
+
+
+def _content_cache(maxsize: int = 64) -> Callable:
+    """
+    Memoize a tool on the content of its arguments.
+    
+    Agents tend to ask several questions about the same meeting series, and
+    each call rebuilds the analysis (changepoints included) from scratch.
+    Arguments are bound to the tool's signature, tool_context is dropped,
+    and the rest is pickled and hashed with blake2b to form the key. Hits
+    return a deep copy so callers can't mutate the cached result; error
+    results and unpicklable arguments are never cached.
+    """
+    def decorator(tool: Callable) -> Callable:
+        signature = inspect.signature(tool)
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @wraps(tool)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            bound.arguments.pop('tool_context', None)
+            try:
+                payload = pickle.dumps(tuple(bound.arguments.items()), protocol=5)
+            except Exception:
+                return tool(*args, **kwargs)
+            key = hashlib.blake2b(payload, digest_size=16).digest()
+            
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return copy.deepcopy(cache[key])
+            
+            result = tool(*args, **kwargs)
+            if isinstance(result, dict) and 'error' not in result:
+                with lock:
+                    cache[key] = copy.deepcopy(result)
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
+@_content_cache()
 def analyze_long_term_trends_tool(
     meeting_data: List[Dict],
     variable: str = 'score',
     min_meetings: int = 24,
+    changepoint_method: str = 'pelt',
     tool_context: Optional[ToolContext] = None
 ) -> Dict:
     """
@@ -48,6 +112,8 @@ def analyze_long_term_trends_tool(
         meeting_data: List of meeting data (recommend 24+ meetings)
         variable: Variable to analyze ('score', 'fed_funds', etc.)
         min_meetings: Minimum meetings required (default: 24 = 6 years)
+        changepoint_method: 'pelt' for mean shifts (default) or 'rbf' to also
+            catch changes in volatility
         tool_context: ADK tool context
     
     Returns:
@@ -73,23 +139,30 @@ def analyze_long_term_trends_tool(
             }
         }
     """
-    logger.info(f"Analyzing long-term trends in {variable}")
+    logger.info("Analyzing long-term trends in %s", variable)
     
     try:
-        analyzer = LongTermAnalyzer()
+        import pandas as pd
+        
+        analyzer = _analysis_module('long_term_analyzer').LongTermAnalyzer()
+        
+        # Build the meeting table once and share it across the analyses
+        meeting_frame = pd.DataFrame(meeting_data)
         
         # Main trend analysis
-        trend = analyzer.analyze_long_term_trend(meeting_data, variable, min_meetings)
+        trend = analyzer.analyze_long_term_trend(
+            meeting_frame, variable, min_meetings, changepoint_method
+        )
         
         if 'error' in trend:
             return trend
         
         # Volatility analysis
-        volatility = analyzer.analyze_volatility(meeting_data, variable)
+        volatility = analyzer.analyze_volatility(meeting_frame, variable)
         
         # Regime persistence (if regime data available)
-        if any('regime' in m for m in meeting_data):
-            regime_persistence = analyzer.detect_regime_persistence(meeting_data)
+        if 'regime' in meeting_frame.columns:
+            regime_persistence = analyzer.detect_regime_persistence(meeting_frame)
         else:
             regime_persistence = None
         
@@ -97,14 +170,15 @@ def analyze_long_term_trends_tool(
             'trend_analysis': trend,
             'volatility': volatility,
             'regime_persistence': regime_persistence,
-            'summary': f"{trend['strength'].replace('_', ' ').title()} {trend['direction'].replace('_', ' ')} detected across {trend['num_meetings']} meetings"
+            'summary': f"{_humanize(trend['strength'], title=True)} {_humanize(trend['direction'])} detected across {trend['num_meetings']} meetings"
         }
         
     except Exception as e:
-        logger.error(f"Error in long-term trend analysis: {e}")
+        logger.error("Error in long-term trend analysis: %s", e)
         return {'error': str(e)}
 
 
+@_content_cache()
 def detect_policy_cycles_tool(
     meeting_data: List[Dict],
     tool_context: Optional[ToolContext] = None
@@ -159,14 +233,15 @@ def detect_policy_cycles_tool(
     logger.info("Detecting policy cycles")
     
     try:
-        result = detect_policy_cycles(meeting_data)
+        result = _analysis_module('cycle_detector').detect_policy_cycles(meeting_data)
         return result
         
     except Exception as e:
-        logger.error(f"Error in cycle detection: {e}")
+        logger.error("Error in cycle detection: %s", e)
         return {'error': str(e)}
 
 
+@_content_cache()
 def analyze_reaction_function_tool(
     meeting_data: List[Dict],
     economic_data: Optional[List[Dict]] = None,
@@ -216,7 +291,7 @@ def analyze_reaction_function_tool(
     logger.info("Analyzing reaction function")
     
     try:
-        analyzer = ReactionFunctionAnalyzer()
+        analyzer = _analysis_module('reaction_forecast_analysis').ReactionFunctionAnalyzer()
         
         results = {}
         
@@ -237,10 +312,11 @@ def analyze_reaction_function_tool(
         return results
         
     except Exception as e:
-        logger.error(f"Error in reaction function analysis: {e}")
+        logger.error("Error in reaction function analysis: %s", e)
         return {'error': str(e)}
 
 
+@_content_cache()
 def track_forecast_bias_tool(
     forecasts: List[Dict],
     actuals: List[Dict],
@@ -289,23 +365,23 @@ def track_forecast_bias_tool(
             }
         }
     """
-    logger.info(f"Tracking forecast bias for {variable}")
+    logger.info("Tracking forecast bias for %s", variable)
     
     try:
-        tracker = ForecastBiasTracker()
+        analysis = _analysis_module('reaction_forecast_analysis')
+        tracker = analysis.ForecastBiasTracker()
         
         # Bias analysis
         bias_analysis = tracker.analyze_forecast_bias(forecasts, actuals, variable)
         
         # Pattern analysis (if we have errors)
         if 'mean_error' in bias_analysis:
-            # Extract errors
-            errors = []
-            timestamps = []
-            for f, a in zip(forecasts, actuals):
-                if 'value' in f and 'value' in a:
-                    errors.append(a['value'] - f['value'])
-                    timestamps.append(f.get('date', len(timestamps)))
+            # Extract errors; only the timestamps need a per-pair lookup
+            errs, kept = analysis.paired_forecast_errors(forecasts, actuals)
+            errors = errs.tolist()
+            timestamps = [
+                forecasts[i].get('date', j) for j, i in enumerate(kept.tolist())
+            ]
             
             if len(errors) >= 8:
                 pattern = tracker.identify_bias_patterns(errors, timestamps)
@@ -320,10 +396,11 @@ def track_forecast_bias_tool(
         }
         
     except Exception as e:
-        logger.error(f"Error in forecast bias tracking: {e}")
+        logger.error("Error in forecast bias tracking: %s", e)
         return {'error': str(e)}
 
 
+@_content_cache()
 def generate_predictive_indicators_tool(
     recent_meetings: List[Dict],
     current_economic_data: Optional[Dict] = None,
@@ -360,7 +437,8 @@ def generate_predictive_indicators_tool(
                     'signal': 'Inflation above 2.5% for 4 consecutive quarters',
                     'lead_time': 3,  # meetings
                     'reliability': 0.80,
-                    'implication': 'Tightening likely in 3 meetings'
+                    'implication': 'Tightening likely in 3 meetings',
+                    'direction': 'tighten'
                 },
                 {
                     'indicator': 'sentiment_shift',
@@ -368,7 +446,8 @@ def generate_predictive_indicators_tool(
                     'signal': '12-point hawkish shift in last 2 meetings',
                     'lead_time': 2,
                     'reliability': 0.75,
-                    'implication': 'Rate hike likely in 2 meetings'
+                    'implication': 'Rate hike likely in 2 meetings',
+                    'direction': 'tighten'
                 }
             ],
             'predicted_action': 'hike',
@@ -380,46 +459,43 @@ def generate_predictive_indicators_tool(
     logger.info("Generating predictive indicators")
     
     try:
-        from trend_tracker_config import LEADING_INDICATORS
-        
         if len(recent_meetings) < 6:
             return {'error': 'Need at least 6 recent meetings'}
         
         active_indicators = []
         
         # Check sentiment shift
-        if len(recent_meetings) >= 3:
-            recent_scores = [m.get('score', 0) for m in recent_meetings[-3:]]
-            older_scores = [m.get('score', 0) for m in recent_meetings[-6:-3]] if len(recent_meetings) >= 6 else []
-            
-            if older_scores:
-                recent_avg = sum(recent_scores) / len(recent_scores)
-                older_avg = sum(older_scores) / len(older_scores)
-                shift = recent_avg - older_avg
-                
-                if abs(shift) >= LEADING_INDICATORS['sentiment_shift']['threshold']:
-                    active_indicators.append({
-                        'indicator': 'sentiment_shift',
-                        'status': 'triggered',
-                        'signal': f'{abs(shift):.0f}-point {"hawkish" if shift > 0 else "dovish"} shift',
-                        'lead_time': LEADING_INDICATORS['sentiment_shift']['lead_time'],
-                        'reliability': LEADING_INDICATORS['sentiment_shift']['reliability'],
-                        'implication': f'{"Rate hike" if shift > 0 else "Rate cut"} likely in {LEADING_INDICATORS["sentiment_shift"]["lead_time"]} meetings'
-                    })
+        spec = LEADING_INDICATORS['sentiment_shift']
+        lead_time = spec['lead_time']
+        scores = [m.get('score', 0) for m in recent_meetings[-6:]]
+        shift = sum(scores[3:]) / 3 - sum(scores[:3]) / 3
+        
+        if abs(shift) >= spec['threshold']:
+            active_indicators.append({
+                'indicator': 'sentiment_shift',
+                'status': 'triggered',
+                'signal': f'{abs(shift):.0f}-point {"hawkish" if shift > 0 else "dovish"} shift',
+                'lead_time': lead_time,
+                'reliability': spec['reliability'],
+                'implication': f'{"Rate hike" if shift > 0 else "Rate cut"} likely in {lead_time} meetings',
+                'direction': 'tighten' if shift > 0 else 'ease'
+            })
         
         # Check inflation persistence (if economic data available)
         if current_economic_data and 'inflation' in current_economic_data:
             inflation = current_economic_data['inflation']
-            threshold = LEADING_INDICATORS['inflation_persistence']['threshold']
+            spec = LEADING_INDICATORS['inflation_persistence']
+            threshold, lead_time = spec['threshold'], spec['lead_time']
             
             if inflation > threshold:
                 active_indicators.append({
                     'indicator': 'inflation_persistence',
                     'status': 'triggered',
                     'signal': f'Inflation at {inflation}% > {threshold}%',
-                    'lead_time': LEADING_INDICATORS['inflation_persistence']['lead_time'],
-                    'reliability': LEADING_INDICATORS['inflation_persistence']['reliability'],
-                    'implication': f'Tightening likely in {LEADING_INDICATORS["inflation_persistence"]["lead_time"]} meetings'
+                    'lead_time': lead_time,
+                    'reliability': spec['reliability'],
+                    'implication': f'Tightening likely in {lead_time} meetings',
+                    'direction': 'tighten'
                 })
         
         # Check unemployment gap
@@ -427,27 +503,37 @@ def generate_predictive_indicators_tool(
             unemployment = current_economic_data['unemployment']
             nairu = 4.0  # Estimate
             gap = nairu - unemployment
-            threshold = LEADING_INDICATORS['unemployment_gap']['threshold']
+            spec = LEADING_INDICATORS['unemployment_gap']
+            threshold, lead_time = spec['threshold'], spec['lead_time']
             
             if gap > threshold:
                 active_indicators.append({
                     'indicator': 'unemployment_gap',
                     'status': 'triggered',
                     'signal': f'Unemployment {gap:.1f}pp below NAIRU',
-                    'lead_time': LEADING_INDICATORS['unemployment_gap']['lead_time'],
-                    'reliability': LEADING_INDICATORS['unemployment_gap']['reliability'],
-                    'implication': f'Tightening likely in {LEADING_INDICATORS["unemployment_gap"]["lead_time"]} meetings'
+                    'lead_time': lead_time,
+                    'reliability': spec['reliability'],
+                    'implication': f'Tightening likely in {lead_time} meetings',
+                    'direction': 'tighten'
                 })
         
+        # Tally direction, reliability and shortest lead time in one pass
+        tightening_signals = 0
+        reliability_sum = 0.0
+        time_horizon = None
+        for ind in active_indicators:
+            tightening_signals += ind['direction'] == 'tighten'
+            reliability_sum += ind['reliability']
+            if time_horizon is None or ind['lead_time'] < time_horizon:
+                time_horizon = ind['lead_time']
+        
         # Determine overall prediction
         if not active_indicators:
             predicted_action = 'unchanged'
             confidence = 0.5
-            time_horizon = None
         else:
             # Most indicators suggest tightening or easing?
-            tightening_signals = sum(1 for ind in active_indicators if 'hike' in ind['implication'].lower() or 'tighten' in ind['implication'].lower())
-            easing_signals = sum(1 for ind in active_indicators if 'cut' in ind['implication'].lower() or 'ease' in ind['implication'].lower())
+            easing_signals = len(active_indicators) - tightening_signals
             
             if tightening_signals > easing_signals:
                 predicted_action = 'hike'
@@ -457,26 +543,33 @@ def generate_predictive_indicators_tool(
                 predicted_action = 'uncertain'
             
             # Confidence based on number and reliability of indicators
-            avg_reliability = sum(ind['reliability'] for ind in active_indicators) / len(active_indicators)
+            avg_reliability = reliability_sum / len(active_indicators)
             signal_strength = min(len(active_indicators) / 3, 1.0)  # Max at 3 indicators
             confidence = avg_reliability * signal_strength
-            
-            # Time horizon = shortest lead time
-            time_horizon = min(ind['lead_time'] for ind in active_indicators)
         
         return {
             'active_indicators': active_indicators,
             'predicted_action': predicted_action,
-            'confidence': round(confidence, 2),
+            # Confidence is never negative, so adding a half and truncating
+            # rounds to cents without a round() call
+            'confidence': int(confidence * 100 + 0.5) / 100.0,
             'time_horizon': time_horizon,
             'interpretation': _interpret_prediction(predicted_action, confidence, time_horizon, len(active_indicators))
         }
         
     except Exception as e:
-        logger.error(f"Error generating predictive indicators: {e}")
+        logger.error("Error generating predictive indicators: %s", e)
         return {'error': str(e)}
 
 
+# Confidence wording, indexed by how many of the 0.5 / 0.75 bars are cleared
+_CONFIDENCE_WORDS = ("Low confidence", "Moderate confidence", "High confidence")
+
+# Months per meeting horizon (~1.5 months apart); round() matches the
+# half-to-even rounding of a ':.0f' format
+_HORIZON_MONTHS = tuple(round(meetings * 1.5) for meetings in range(64))
+
+
 def _interpret_prediction(
     action: str,
     confidence: float,
@@ -488,15 +581,14 @@ def _interpret_prediction(
     if action == 'unchanged':
         return "No strong signals for policy change detected"
     
-    if confidence >= 0.75:
-        conf_word = "High confidence"
-    elif confidence >= 0.5:
-        conf_word = "Moderate confidence"
-    else:
-        conf_word = "Low confidence"
+    conf_word = _CONFIDENCE_WORDS[(confidence >= 0.5) + (confidence >= 0.75)]
     
     if time_horizon:
-        return f"{conf_word} {action} expected in ~{time_horizon} meetings ({time_horizon * 1.5:.0f} months) based on {num_indicators} indicators"
+        if time_horizon < len(_HORIZON_MONTHS):
+            months = _HORIZON_MONTHS[time_horizon]
+        else:
+            months = round(time_horizon * 1.5)
+        return f"{conf_word} {action} expected in ~{time_horizon} meetings ({months} months) based on {num_indicators} indicators"
     else:
         return f"{conf_word} {action} expected based on {num_indicators} indicators"
 
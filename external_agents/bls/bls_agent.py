@@ -7,59 +7,68 @@ Exposes BLS tools via A2A protocol.
 
 import asyncio
 import logging
-from typing import Optional
-from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from google.adk.tools import FunctionTool
-from google.adk.a2a import to_a2a
-from google.genai import types
+from typing import TYPE_CHECKING, Optional
 
 # Handle relative imports for package usage and absolute for direct execution
 try:
-    from .bls_tools import (
-        get_cpi_components,
-        get_ppi_data,
-        get_employment_cost_index,
-        compare_inflation_measures,
-        analyze_inflation_drivers
-    )
     from .bls_config import A2A_HOST, A2A_PORT
 except ImportError:
     # Fallback for direct execution
-    from bls_tools import (
-        get_cpi_components,
-        get_ppi_data,
-        get_employment_cost_index,
-        compare_inflation_measures,
-        analyze_inflation_drivers
-    )
     from bls_config import A2A_HOST, A2A_PORT
 
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Configure retry options for Gemini
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504],
-)
-
-
-def create_bls_agent(model: str = "gemini-2.5-flash-lite") -> LlmAgent:
+def create_bls_agent(model: str = "gemini-2.5-flash-lite") -> "LlmAgent":
     """
     Create the BLS inflation analysis agent with all tools.
     
+    ADK, genai and the tools (with pandas/numpy behind them) are imported
+    here rather than at module load, so startup output isn't held up.
+    
     Args:
         model: Gemini model to use
     
     Returns:
         Configured LlmAgent
     """
+    from google.adk.agents import LlmAgent
+    from google.adk.models.google_llm import Gemini
+    from google.adk.tools import FunctionTool
+    from google.genai import types
+    
+    try:
+        from .bls_tools import (
+            get_cpi_components,
+            get_ppi_data,
+            get_employment_cost_index,
+            compare_inflation_measures,
+            analyze_inflation_drivers
+        )
+    except ImportError:
+        # Fallback for direct execution
+        from bls_tools import (
+            get_cpi_components,
+            get_ppi_data,
+            get_employment_cost_index,
+            compare_inflation_measures,
+            analyze_inflation_drivers
+        )
+    
     logger.info("Creating BLS agent")
     
+    # Configure retry options for Gemini
+    retry_config = types.HttpRetryOptions(
+        attempts=5,
+        exp_base=7,
+        initial_delay=1,
+        http_status_codes=[429, 500, 503, 504],
+    )
+    
     agent = LlmAgent(
         name="bls_inflation_agent",
         model=Gemini(model=model, retry_options=retry_config),
@@ -155,7 +164,7 @@ def create_bls_agent(model: str = "gemini-2.5-flash-lite") -> LlmAgent:
 
 
 async def run_a2a_server(
-    agent: Optional[LlmAgent] = None,
+    agent: Optional["LlmAgent"] = None,
     host: str = A2A_HOST,
     port: int = A2A_PORT
 ):
@@ -167,6 +176,8 @@ async def run_a2a_server(
         host: Server host
         port: Server port
     """
+    from google.adk.a2a import to_a2a
+    
     if agent is None:
         agent = create_bls_agent()
     
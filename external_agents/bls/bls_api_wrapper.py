@@ -9,14 +9,36 @@ Handles all interactions with the Bureau of Labor Statistics API:
 - Error handling
 """
 
+import json
 import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 from cachetools import TTLCache
 
+# Optional shared cache
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional faster JSON decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Handle relative imports for package usage and absolute for direct execution
 try:
     from .bls_config import (
@@ -26,7 +48,14 @@ try:
         BLS_SERIES_MAP,
         CACHE_TTL_SECONDS,
         MAX_CACHE_SIZE,
-        DEFAULT_START_YEAR
+        REDIS_URL,
+        DISK_CACHE_DIR,
+        DEFAULT_START_YEAR,
+        HTTP_POOL_CONNECTIONS,
+        HTTP_POOL_MAXSIZE,
+        HTTP_MAX_RETRIES,
+        HTTP_RETRY_BACKOFF,
+        HTTP_RETRY_STATUSES
     )
 except ImportError:
     from bls_config import (
@@ -36,13 +65,31 @@ except ImportError:
         BLS_SERIES_MAP,
         CACHE_TTL_SECONDS,
         MAX_CACHE_SIZE,
-        DEFAULT_START_YEAR
+        REDIS_URL,
+        DISK_CACHE_DIR,
+        DEFAULT_START_YEAR,
+        HTTP_POOL_CONNECTIONS,
+        HTTP_POOL_MAXSIZE,
+        HTTP_MAX_RETRIES,
+        HTTP_RETRY_BACKOFF,
+        HTTP_RETRY_STATUSES
     )
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Month index (0-11) of each monthly BLS period; annual averages (M13),
+# quarters, etc. have no monthly date
+_PERIOD_MONTH = {f"M{month:02d}": month - 1 for month in range(1, 13)}
+
+# Resolution pd.to_datetime gives parsed dates (ns in pandas 2, us in 3),
+# and the one it falls back to when no period parsed at all
+_DATE_DTYPE = pd.to_datetime(pd.Series(["2000-01"]), format="%Y-%m").dtype
+_NO_DATE_DTYPE = pd.to_datetime(
+    pd.Series(["2000-Q01"]), format="%Y-%m", errors="coerce"
+).dtype
+
 
 class BLSAPIWrapper:
     """
@@ -61,6 +108,48 @@ class BLSAPIWrapper:
         self.api_key = api_key
         self.cache = TTLCache(maxsize=MAX_CACHE_SIZE, ttl=CACHE_TTL_SECONDS)
         
+        # Keep-alive session so repeated fetches reuse the TLS connection.
+        # BLS reads are POSTs, so POST has to be opted in to retries.
+        retry = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry
+        ))
+        self.session.headers.update({"Content-type": "application/json"})
+        
+        # Optional second cache tier in Redis, shared between agent processes
+        # and kept across restarts; holds the raw series JSON, not pickles
+        self.redis = None
+        if REDIS_URL:
+            if REDIS_AVAILABLE:
+                self.redis = redis.Redis.from_url(
+                    REDIS_URL, socket_connect_timeout=1, socket_timeout=1
+                )
+            else:
+                logger.warning("REDIS_URL set but redis is not installed - using in-process cache only")
+        
+        # Optional on-disk tier with the same raw JSON, for single-process
+        # deployments without Redis; entries expire by file age
+        self.disk_cache_dir = None
+        if DISK_CACHE_DIR:
+            try:
+                os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+                self.disk_cache_dir = DISK_CACHE_DIR
+            except OSError as e:
+                logger.warning(f"Disk cache unavailable at {DISK_CACHE_DIR}: {e}")
+        
+        # Current calendar year and the local time at which it rolls over
+        self._year = 0
+        self._year_ends = 0.0
+        
         # Use v2 API if we have a key, v1 otherwise
         self.api_url = BLS_API_URL if api_key else BLS_API_V1_URL
         self.api_version = "v2" if api_key else "v1"
@@ -69,6 +158,158 @@ class BLSAPIWrapper:
         if not api_key:
             logger.warning("No BLS API key provided - using v1 API with lower rate limits")
     
+    def _current_year(self) -> int:
+        """Current calendar year, refreshed only once the year rolls over."""
+        now = time.time()
+        if now >= self._year_ends:
+            self._year = datetime.fromtimestamp(now).year
+            self._year_ends = datetime(self._year + 1, 1, 1).timestamp()
+        return self._year
+    
+    @staticmethod
+    def _cache_key(series_id: str, start_year: int, end_year: int) -> str:
+        """Cache key for one series over a year range."""
+        return f"{series_id}_{start_year}_{end_year}"
+    
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Dict:
+        """Decode a BLS response body, with orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    @staticmethod
+    def _parse_series_payload(series_data: List[Dict]) -> pd.DataFrame:
+        """
+        Convert one series' BLS 'data' records into a date-sorted DataFrame.
+        
+        Args:
+            series_data: Records with year, period, periodName and value
+        
+        Returns:
+            DataFrame with columns: date, value, year, period, periodName
+        """
+        df = pd.DataFrame(series_data)
+        
+        # Parse dates as months since 1970, without building date strings
+        month = np.fromiter(
+            (_PERIOD_MONTH.get(period, -1) for period in df['period'].tolist()),
+            dtype=np.int64,
+            count=len(df)
+        )
+        year = df['year'].to_numpy().astype(np.int64)
+        dates = ((year - 1970) * 12 + month).astype('datetime64[M]')
+        dates[month < 0] = np.datetime64('NaT')
+        df['date'] = dates.astype(
+            _DATE_DTYPE if (month >= 0).any() else _NO_DATE_DTYPE
+        )
+        
+        # Convert value to float
+        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        
+        # Year and period labels repeat across rows, so store them as
+        # categories; per-row footnote lists and the 'latest' flag are unused
+        for col in ('year', 'period', 'periodName'):
+            if col in df:
+                df[col] = df[col].astype('category')
+        df = df.drop(columns=['footnotes', 'latest'], errors='ignore')
+        
+        # Sort by date (stable, so ties keep BLS order; NaT sorts last)
+        df = df.take(np.argsort(dates, kind='stable'))
+        df.index = pd.RangeIndex(len(df))
+        return df
+    
+    def _cached_series(
+        self,
+        series_id: str,
+        start_year: int,
+        end_year: int
+    ) -> Optional[pd.DataFrame]:
+        """Look a series up in the in-process cache, then Redis, then on disk."""
+        cache_key = self._cache_key(series_id, start_year, end_year)
+        df = self.cache.get(cache_key)
+        if df is not None:
+            return df
+        
+        raw = None
+        if self.redis is not None:
+            try:
+                raw = self.redis.get(f"bls:{self.api_version}:{cache_key}")
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache unavailable, using in-process cache only: {e}")
+                self.redis = None
+        if raw is None and self.disk_cache_dir:
+            raw = self._read_disk_cache(cache_key)
+        if raw is None:
+            return None
+        
+        df = self._parse_series_payload(json.loads(raw))
+        self.cache[cache_key] = df
+        return df
+    
+    def _store_series(
+        self,
+        series_id: str,
+        start_year: int,
+        end_year: int,
+        series_data: List[Dict],
+        df: pd.DataFrame
+    ) -> None:
+        """Cache a parsed series in-process and its raw records in Redis/on disk."""
+        cache_key = self._cache_key(series_id, start_year, end_year)
+        self.cache[cache_key] = df
+        if self.redis is None and not self.disk_cache_dir:
+            return
+        
+        raw = json.dumps(series_data)
+        if self.redis is not None:
+            try:
+                self.redis.setex(
+                    f"bls:{self.api_version}:{cache_key}",
+                    CACHE_TTL_SECONDS,
+                    raw
+                )
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache unavailable, using in-process cache only: {e}")
+                self.redis = None
+        if self.disk_cache_dir:
+            self._write_disk_cache(cache_key, raw)
+    
+    def _disk_cache_path(self, cache_key: str) -> str:
+        """File holding one cached series' raw records."""
+        return os.path.join(self.disk_cache_dir, f"{self.api_version}_{cache_key}.json")
+    
+    def _read_disk_cache(self, cache_key: str) -> Optional[bytes]:
+        """Raw records from disk, or None if missing, expired or unreadable."""
+        path = self._disk_cache_path(cache_key)
+        try:
+            if time.time() - os.path.getmtime(path) >= CACHE_TTL_SECONDS:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_disk_cache(self, cache_key: str, raw: str) -> None:
+        """Write raw records to disk atomically, so readers never see partial files."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(raw)
+            os.replace(tmp_path, self._disk_cache_path(cache_key))
+        except OSError as e:
+            logger.warning(f"Could not write disk cache for {cache_key}: {e}")
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "BLSAPIWrapper":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def get_series(
         self,
         series_id: str,
@@ -91,13 +332,12 @@ class BLSAPIWrapper:
         if start_year is None:
             start_year = DEFAULT_START_YEAR
         if end_year is None:
-            end_year = datetime.now().year
+            end_year = self._current_year()
         
-        cache_key = f"{series_id}_{start_year}_{end_year}"
-        
-        if cache_key in self.cache:
+        cached = self._cached_series(series_id, start_year, end_year)
+        if cached is not None:
             logger.debug(f"Cache hit for {series_id}")
-            return self.cache[cache_key]
+            return cached
         
         try:
             logger.info(f"Fetching {series_id} from BLS API ({start_year}-{end_year})")
@@ -122,17 +362,15 @@ class BLSAPIWrapper:
                 payload["annualaverage"] = True
             
             # Make API request
-            headers = {"Content-type": "application/json"}
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 json=payload,
-                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
             
             # Parse response
-            data = response.json()
+            data = self._decode_response(response)
             
             if data.get("status") != "REQUEST_SUCCEEDED":
                 error_msg = data.get("message", ["Unknown error"])[0]
@@ -142,23 +380,10 @@ class BLSAPIWrapper:
             series_data = data["Results"]["series"][0]["data"]
             
             # Convert to DataFrame
-            df = pd.DataFrame(series_data)
-            
-            # Parse dates
-            df['date'] = pd.to_datetime(
-                df['year'] + '-' + df['period'].str.replace('M', ''),
-                format='%Y-%m',
-                errors='coerce'
-            )
-            
-            # Convert value to float
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            
-            # Sort by date
-            df = df.sort_values('date').reset_index(drop=True)
+            df = self._parse_series_payload(series_data)
             
             # Cache the result
-            self.cache[cache_key] = df
+            self._store_series(series_id, start_year, end_year, series_data, df)
             
             return df
             
@@ -178,6 +403,9 @@ class BLSAPIWrapper:
         """
         Get multiple BLS series in a single request (more efficient).
         
+        Series share the get_series cache: ones already fetched for the same
+        years are not requested again, and each fetched series is cached.
+        
         Args:
             series_ids: List of BLS series identifiers
             start_year: Start year
@@ -189,68 +417,108 @@ class BLSAPIWrapper:
         if start_year is None:
             start_year = DEFAULT_START_YEAR
         if end_year is None:
-            end_year = datetime.now().year
+            end_year = self._current_year()
+        
+        all_results = {}
+        
+        # Serve cached series and only request the rest
+        missing = []
+        for series_id in series_ids:
+            cached = self._cached_series(series_id, start_year, end_year)
+            if cached is not None:
+                all_results[series_id] = cached
+            else:
+                missing.append(series_id)
         
         # BLS API allows max 50 series per request (v2) or 25 (v1)
         max_series = 50 if self.api_key else 25
         
-        if len(series_ids) > max_series:
-            logger.warning(f"Requesting {len(series_ids)} series, will batch into multiple requests")
+        if len(missing) > max_series:
+            logger.warning(f"Requesting {len(missing)} series, will batch into multiple requests")
+        
+        batches = [
+            missing[i:i+max_series] for i in range(0, len(missing), max_series)
+        ]
+        
+        # Batches are independent, so post them concurrently over the pooled
+        # session; results are merged and cached on this thread
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(batches), HTTP_POOL_MAXSIZE)) as executor:
+                batch_results = list(executor.map(
+                    lambda batch: self._fetch_batch(batch, start_year, end_year),
+                    batches
+                ))
+        else:
+            batch_results = [
+                self._fetch_batch(batch, start_year, end_year) for batch in batches
+            ]
+        
+        for batch_result in batch_results:
+            for series_id, series_data in batch_result.items():
+                df = self._parse_series_payload(series_data)
+                all_results[series_id] = df
+                self._store_series(series_id, start_year, end_year, series_data, df)
         
-        all_results = {}
+        return all_results
+    
+    def _fetch_batch(
+        self,
+        batch: List[str],
+        start_year: int,
+        end_year: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch one batch of series in a single request.
+        
+        Errors are logged and give an empty result, so one failed batch
+        doesn't lose the others.
+        
+        Returns:
+            Dictionary mapping series_id to its raw 'data' records
+        """
+        results = {}
         
-        # Batch requests
-        for i in range(0, len(series_ids), max_series):
-            batch = series_ids[i:i+max_series]
+        try:
+            logger.info(f"Fetching batch of {len(batch)} series")
             
-            try:
-                logger.info(f"Fetching batch of {len(batch)} series")
-                
-                payload = {
-                    "seriesid": batch,
-                    "startyear": str(start_year),
-                    "endyear": str(end_year)
-                }
-                
-                if self.api_key:
-                    payload["registrationkey"] = self.api_key
-                
-                headers = {"Content-type": "application/json"}
-                response = requests.post(
-                    self.api_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if data.get("status") != "REQUEST_SUCCEEDED":
-                    error_msg = data.get("message", ["Unknown error"])[0]
-                    raise ValueError(f"BLS API error: {error_msg}")
-                
-                # Parse each series
-                for series_obj in data["Results"]["series"]:
-                    series_id = series_obj["seriesID"]
-                    series_data = series_obj["data"]
-                    
-                    df = pd.DataFrame(series_data)
-                    df['date'] = pd.to_datetime(
-                        df['year'] + '-' + df['period'].str.replace('M', ''),
-                        format='%Y-%m',
-                        errors='coerce'
-                    )
-                    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                    df = df.sort_values('date').reset_index(drop=True)
-                    
-                    all_results[series_id] = df
-                
-            except Exception as e:
-                logger.error(f"Error fetching batch: {e}")
-                # Continue with next batch
+            payload = {
+                "seriesid": batch,
+                "startyear": str(start_year),
+                "endyear": str(end_year)
+            }
+            
+            if self.api_key:
+                payload["registrationkey"] = self.api_key
+            
+            response = self.session.post(
+                self.api_url,
+                json=payload,
+                timeout=30
+            )
+            response.raise_for_status()
+            
+            data = self._decode_response(response)
+            
+            if data.get("status") != "REQUEST_SUCCEEDED":
+                error_msg = data.get("message", ["Unknown error"])[0]
+                raise ValueError(f"BLS API error: {error_msg}")
+            
+            results = dict(map(itemgetter("seriesID", "data"), data["Results"]["series"]))
+            
+        except Exception as e:
+            logger.error(f"Error fetching batch: {e}")
         
-        return all_results
+        return results
+    
+    @staticmethod
+    def _percent_change(values: pd.Series, periods: int) -> np.ndarray:
+        """Percent change vs. `periods` rows earlier; NaN where undefined."""
+        values = values.to_numpy(dtype=np.float64)
+        change = np.full(len(values), np.nan)
+        if periods < len(values):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change[periods:] = (values[periods:] / values[:-periods] - 1.0) * 100
+        return change
     
     def calculate_yoy_change(
         self,
@@ -267,9 +535,7 @@ class BLSAPIWrapper:
         Returns:
             DataFrame with additional 'yoy_change' column
         """
-        df = df.copy()
-        df['yoy_change'] = df['value'].pct_change(periods=periods) * 100
-        return df
+        return df.assign(yoy_change=self._percent_change(df['value'], periods))
     
     def calculate_mom_change(
         self,
@@ -284,9 +550,7 @@ class BLSAPIWrapper:
         Returns:
             DataFrame with additional 'mom_change' column
         """
-        df = df.copy()
-        df['mom_change'] = df['value'].pct_change(periods=1) * 100
-        return df
+        return df.assign(mom_change=self._percent_change(df['value'], 1))
     
     def get_latest_value(
         self,
@@ -302,30 +566,32 @@ class BLSAPIWrapper:
             Dictionary with latest value and metadata
         """
         # Get last 2 years of data to ensure we have recent values
-        current_year = datetime.now().year
+        current_year = self._current_year()
         df = self.get_series(series_id, start_year=current_year - 2, end_year=current_year)
         
         if df.empty:
             return None
         
         # Get latest non-null value
-        df_valid = df[df['value'].notna()]
-        if df_valid.empty:
+        values = df['value'].to_numpy(dtype=np.float64)
+        rows = np.flatnonzero(~np.isnan(values))
+        if not len(rows):
             return None
         
-        latest = df_valid.iloc[-1]
+        latest = df.iloc[rows[-1]]
+        valid = values[rows]
         
-        # Calculate changes if we have enough data
+        # Only the latest change is needed, so compare against the
+        # observations 1 and 12 valid readings back directly
         yoy_change = None
         mom_change = None
         
-        if len(df_valid) >= 12:
-            df_with_yoy = self.calculate_yoy_change(df_valid)
-            yoy_change = df_with_yoy.iloc[-1]['yoy_change']
-        
-        if len(df_valid) >= 2:
-            df_with_mom = self.calculate_mom_change(df_valid)
-            mom_change = df_with_mom.iloc[-1]['mom_change']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if len(valid) >= 13:
+                yoy_change = (valid[-1] / valid[-13] - 1.0) * 100
+            
+            if len(valid) >= 2:
+                mom_change = (valid[-1] / valid[-2] - 1.0) * 100
         
         return {
             'series_id': series_id,
@@ -395,25 +661,32 @@ class BLSAPIWrapper:
             if df is None or df.empty:
                 continue
             
-            df_with_yoy = self.calculate_yoy_change(df)
+            values = df['value'].to_numpy(dtype=np.float64)
+            dates = df['date'].to_numpy()
             
-            # Get value at specific date or latest
+            # Get row at specific date or latest; dates are sorted with NaT
+            # last, so rows on or before the target are a prefix
             if as_of_date:
-                target_date = pd.to_datetime(as_of_date)
-                df_filtered = df_with_yoy[df_with_yoy['date'] <= target_date]
-                if not df_filtered.empty:
-                    row = df_filtered.iloc[-1]
-                else:
+                target_date = pd.to_datetime(as_of_date).to_datetime64()
+                i = np.searchsorted(dates, target_date, side='right') - 1
+                if i < 0:
                     continue
             else:
-                row = df_with_yoy.iloc[-1]
+                i = len(df) - 1
+            
+            # YoY against the row 12 positions back, as calculate_yoy_change
+            yoy_change = np.nan
+            if i >= 12:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    yoy_change = (values[i] / values[i - 12] - 1.0) * 100
             
+            date = pd.Timestamp(dates[i])
             comparison.append({
                 'component': name,
                 'series_id': series_id,
-                'date': row['date'].strftime('%Y-%m-%d') if pd.notna(row['date']) else None,
-                'value': float(row['value']) if pd.notna(row['value']) else None,
-                'yoy_change': float(row['yoy_change']) if pd.notna(row['yoy_change']) else None
+                'date': date.strftime('%Y-%m-%d') if pd.notna(date) else None,
+                'value': float(values[i]) if pd.notna(values[i]) else None,
+                'yoy_change': float(yoy_change) if pd.notna(yoy_change) else None
             })
         
         return pd.DataFrame(comparison)
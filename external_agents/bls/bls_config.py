@@ -41,6 +41,10 @@ BLS_API_V1_URL = "https://api.bls.gov/publicAPI/v1/timeseries/data/"
 # Cache Configuration
 CACHE_TTL_SECONDS = 3600  # 1 hour cache
 MAX_CACHE_SIZE = 1000
+# Optional Redis cache shared across processes/restarts (e.g. redis://localhost:6379/0)
+REDIS_URL = os.getenv("REDIS_URL", "")
+# Optional on-disk cache directory, kept across restarts without Redis
+DISK_CACHE_DIR = os.getenv("BLS_DISK_CACHE_DIR", "")
 
 # API Rate Limits
 # Without API key: 25 queries per day, 10 years per query
@@ -48,6 +52,14 @@ MAX_CACHE_SIZE = 1000
 RATE_LIMIT_NO_KEY = 25
 RATE_LIMIT_WITH_KEY = 500
 
+# HTTP Connection Configuration
+# One pooled keep-alive session per wrapper; transient failures are retried
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.5  # seconds, doubled per retry
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 # BLS Series IDs
 # Format: CUUR0000SA0 = CPI-U (Urban) for US City Average, All Items
 # CUUR = CPI Urban consumers
@@ -423,9 +435,18 @@ __all__ = [
     # Cache and limits
     "CACHE_TTL_SECONDS",
     "MAX_CACHE_SIZE",
+    "REDIS_URL",
+    "DISK_CACHE_DIR",
     "RATE_LIMIT_NO_KEY",
     "RATE_LIMIT_WITH_KEY",
     
+    # HTTP connections
+    "HTTP_POOL_CONNECTIONS",
+    "HTTP_POOL_MAXSIZE",
+    "HTTP_MAX_RETRIES",
+    "HTTP_RETRY_BACKOFF",
+    "HTTP_RETRY_STATUSES",
+    
     # Defaults
     "DEFAULT_START_YEAR",
     "DEFAULT_CALCULATION_BASE",
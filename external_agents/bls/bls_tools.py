@@ -22,6 +22,16 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _component_series_ids(components: List[str]) -> List[str]:
+    """Series IDs for the given CPI component categories, without duplicates."""
+    return list(dict.fromkeys(
+        BLS_SERIES_MAP[key]['series_id']
+        for category in components
+        for key in CPI_COMPONENTS.get(category, [])
+        if key in BLS_SERIES_MAP
+    ))
+
+
 def get_cpi_components(
     start_year: int = 2020,
     end_year: Optional[int] = None,
@@ -79,6 +89,9 @@ def get_cpi_components(
         'components': {}
     }
     
+    # Fetch every category in one call rather than one request per category
+    all_data = bls.get_multiple_series(_component_series_ids(components), start_year, end_year)
+    
     for component_category in components:
         if component_category not in CPI_COMPONENTS:
             logger.warning(f"Unknown component category: {component_category}")
@@ -91,9 +104,6 @@ def get_cpi_components(
         if not series_ids:
             continue
         
-        # Fetch data
-        component_data = bls.get_multiple_series(series_ids, start_year, end_year)
-        
         # Process each sub-component
         component_results = {}
         
@@ -104,7 +114,7 @@ def get_cpi_components(
             series_id = BLS_SERIES_MAP[series_key]['series_id']
             series_name = BLS_SERIES_MAP[series_key]['name']
             
-            df = component_data.get(series_id)
+            df = all_data.get(series_id)
             if df is None or df.empty:
                 continue
             
@@ -558,14 +568,22 @@ def analyze_inflation_drivers(
     
     logger.info(f"Analyzing inflation drivers as of {as_of_date or 'latest'}")
     
-    # Get key components
     components = ["food", "energy", "housing", "transportation", "services"]
-    component_data = get_cpi_components(start_year, end_year, components)
-    
-    # Get overall CPI
     cpi_all_id = BLS_SERIES_MAP['cpi_all']['series_id']
     cpi_core_id = BLS_SERIES_MAP['cpi_core']['series_id']
     
+    # Fetch components and overall CPI together; the calls below are then
+    # served from the wrapper's cache
+    bls.get_multiple_series(
+        _component_series_ids(components) + [cpi_all_id, cpi_core_id],
+        start_year,
+        end_year
+    )
+    
+    # Get key components
+    component_data = get_cpi_components(start_year, end_year, components)
+    
+    # Get overall CPI
     overall_data = bls.get_multiple_series([cpi_all_id, cpi_core_id], start_year, end_year)
     
     cpi_all_df = bls.calculate_yoy_change(overall_data[cpi_all_id])
@@ -13,6 +13,13 @@ from google.adk.tools import FunctionTool
 from google.adk.a2a import to_a2a
 from google.genai import types
 
+# Optional faster event loop for the A2A server (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Handle relative imports for package usage and absolute for direct execution
 try:
     from .fred_tools import (
@@ -172,8 +179,12 @@ def main():
         logger.info("=" * 60)
         logger.info("")
         
-        # Run the A2A server
-        asyncio.run(run_a2a_server())
+        # Run the A2A server, on uvloop when installed and the default
+        # asyncio loop otherwise
+        if UVLOOP_AVAILABLE:
+            uvloop.run(run_a2a_server())
+        else:
+            asyncio.run(run_a2a_server())
         
     except KeyboardInterrupt:
         logger.info("\nShutting down FRED agent...")
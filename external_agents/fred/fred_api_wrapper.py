@@ -21,6 +21,7 @@ try:
     from .fred_config import (
         FRED_API_KEY,
         FRED_SERIES_MAP,
+        SERIES_ID_TO_KEY,
         CACHE_TTL_SECONDS,
         MAX_CACHE_SIZE,
     )
@@ -28,6 +29,7 @@ except ImportError:
     from fred_config import (
         FRED_API_KEY,
         FRED_SERIES_MAP,
+        SERIES_ID_TO_KEY,
         CACHE_TTL_SECONDS,
         MAX_CACHE_SIZE,
     )
@@ -207,7 +209,7 @@ class FREDAPIWrapper:
             'value': float(latest_value),
             'change': float(change) if change is not None else None,
             'pct_change': float(pct_change) if pct_change is not None else None,
-            'units': FRED_SERIES_MAP.get(series_id, {}).get('units', 'Unknown')
+            'units': FRED_SERIES_MAP.get(SERIES_ID_TO_KEY.get(series_id), {}).get('units', 'Unknown')
         }
     
     def get_series_range(
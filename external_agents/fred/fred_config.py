@@ -6,14 +6,16 @@ Handles API keys, constants, and configuration settings.
 
 import os
 import warnings
-from dotenv import load_dotenv
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-# Load environment variables
-try:
-    load_dotenv()
-except Exception as e:
-    warnings.warn(f"Could not load .env file: {e}")
+# Load environment variables from .env; deployments that inject them directly
+# can set FRED_ENV_LOADED=1 to skip importing python-dotenv and the file search
+if not os.getenv("FRED_ENV_LOADED"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except Exception as e:
+        warnings.warn(f"Could not load .env file: {e}")
 
 # API Configuration
 FRED_API_KEY = os.getenv("FRED_API_KEY", "")
@@ -207,6 +209,16 @@ INDICATOR_CATEGORIES: Dict[str, List[str]] = {
     "sentiment": ["consumer_sentiment", "consumer_confidence"]
 }
 
+# Reverse lookups, built once at import: FRED series ID -> series key,
+# and the series IDs in each category
+SERIES_ID_TO_KEY: Dict[str, str] = {
+    info["series_id"]: key for key, info in FRED_SERIES_MAP.items()
+}
+CATEGORY_TO_SERIES_IDS: Dict[str, Tuple[str, ...]] = {
+    category: tuple(FRED_SERIES_MAP[key]["series_id"] for key in keys)
+    for category, keys in INDICATOR_CATEGORIES.items()
+}
+
 # Default date ranges
 DEFAULT_START_DATE = "2005-01-01"  # Match FOMC document coverage
 
@@ -223,19 +235,8 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def get_api_info() -> Dict[str, any]:
-    """Get current API configuration information."""
-    return {
-        "has_api_key": bool(FRED_API_KEY),
-        "api_key_length": len(FRED_API_KEY) if FRED_API_KEY else 0,
-        "host": A2A_HOST,
-        "port": A2A_PORT,
-        "rate_limit": FRED_RATE_LIMIT_WITH_KEY if FRED_API_KEY else FRED_RATE_LIMIT_NO_KEY
-    }
-
-
-def validate_config() -> List[str]:
-    """Validate configuration and return list of issues."""
+def _collect_config_issues() -> List[str]:
+    """Check the API key and port settings above and return list of issues."""
     issues = []
     
     if not FRED_API_KEY:
@@ -249,8 +250,30 @@ def validate_config() -> List[str]:
     return issues
 
 
+# Settings are fixed once the module is loaded, so check them once here
+_CONFIG_ISSUES = tuple(_collect_config_issues())
+_HAS_CRITICAL_ISSUES = any(
+    "invalid" in issue.lower() or "not be valid" in issue for issue in _CONFIG_ISSUES
+)
+_API_INFO = {
+    "has_api_key": bool(FRED_API_KEY),
+    "api_key_length": len(FRED_API_KEY) if FRED_API_KEY else 0,
+    "host": A2A_HOST,
+    "port": A2A_PORT,
+    "rate_limit": FRED_RATE_LIMIT_WITH_KEY if FRED_API_KEY else FRED_RATE_LIMIT_NO_KEY
+}
+
+
+def get_api_info() -> Dict[str, any]:
+    """Get current API configuration information."""
+    return dict(_API_INFO)
+
+
+def validate_config() -> List[str]:
+    """Validate configuration and return list of issues."""
+    return list(_CONFIG_ISSUES)
+
+
 def is_fully_loaded() -> bool:
     """Check if all required configuration is properly loaded."""
-    issues = validate_config()
-    critical_issues = [issue for issue in issues if "invalid" in issue.lower() or "not be valid" in issue]
-    return len(critical_issues) == 0
+    return not _HAS_CRITICAL_ISSUES